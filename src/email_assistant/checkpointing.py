@@ -10,9 +10,11 @@ import atexit
 import logging
 import os
 import sqlite3
+import threading
+import weakref
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.checkpoint.sqlite import SqliteSaver
@@ -25,13 +27,46 @@ from langgraph.store.sqlite import SqliteStore
 _DEFAULT_CHECKPOINT_FILENAME = "email_assistant_checkpoints.sqlite"
 _DEFAULT_STORE_FILENAME = "email_assistant_store.sqlite"
 _DEFAULT_SQLITE_TIMEOUT_SECONDS = 30.0
+_DEFAULT_SQLITE_CACHE_KB = 16000
+_DEFAULT_WAL_CHECKPOINT_SECONDS = 30.0
+# Saver/store issue a small, repetitive SQL vocabulary; a larger prepared
+# statement cache (driver default: 128) keeps all of it parse-free.
+_SQLITE_CACHED_STATEMENTS = 256
 
 
 logger = logging.getLogger(__name__)
 
+# Autocheckpointing is disabled on our connections so the commit that pushes
+# the WAL past its threshold does not stall the caller; instead a daemon thread
+# per database path runs PASSIVE checkpoints on an interval. Each path maps to
+# its stop event and the number of open savers/stores using it; the thread
+# stops once the last of them is closed, or at interpreter exit.
+_WAL_CHECKPOINT_PATHS: dict[Path, list[Any]] = {}
+_WAL_CHECKPOINT_LOCK = threading.Lock()
 
+
+def _stop_all_wal_checkpointers() -> None:
+    with _WAL_CHECKPOINT_LOCK:
+        stops = [entry[0] for entry in _WAL_CHECKPOINT_PATHS.values()]
+    for stop in stops:
+        stop.set()
+
+
+atexit.register(_stop_all_wal_checkpointers)
+
+# Store paths whose schema/migrations were applied in this process. Reopening
+# such a path (e.g. after lru_cache eviction) skips SqliteStore.setup() as long
+# as the migrations table still exists, so recreated pytest databases are
+# still initialised.
+_INITIALIZED_STORE_PATHS: set[Path] = set()
+
+
+@lru_cache(maxsize=16)
 def _resolve_path(env_value: Optional[str], fallback_filename: str) -> Path:
-    """Return an absolute path for SQLite artefacts, creating folders as needed."""
+    """Return an absolute path for SQLite artefacts, creating folders as needed.
+
+    Memoised so repeated lookups skip the expanduser/cwd/mkdir syscalls.
+    """
 
     if env_value:
         path = Path(env_value).expanduser()
@@ -73,22 +108,268 @@ def _resolve_timeout_seconds() -> float:
     return timeout
 
 
+def _resolve_cache_kb() -> int:
+    """Parse the SQLite page-cache size (KiB) env var, falling back when invalid."""
+
+    raw_value = os.getenv("EMAIL_ASSISTANT_SQLITE_CACHE_KB")
+    if raw_value is None:
+        return _DEFAULT_SQLITE_CACHE_KB
+
+    try:
+        cache_kb = int(raw_value)
+    except ValueError:
+        logger.warning(
+            "Invalid EMAIL_ASSISTANT_SQLITE_CACHE_KB=%r; falling back to %d KiB",
+            raw_value,
+            _DEFAULT_SQLITE_CACHE_KB,
+        )
+        return _DEFAULT_SQLITE_CACHE_KB
+
+    if cache_kb <= 0:
+        logger.warning(
+            "Non-positive EMAIL_ASSISTANT_SQLITE_CACHE_KB=%r; falling back to %d KiB",
+            raw_value,
+            _DEFAULT_SQLITE_CACHE_KB,
+        )
+        return _DEFAULT_SQLITE_CACHE_KB
+
+    return cache_kb
+
+
+def _resolve_wal_checkpoint_seconds() -> float:
+    """Parse the WAL checkpoint interval env var, falling back when invalid."""
+
+    raw_value = os.getenv("EMAIL_ASSISTANT_WAL_CHECKPOINT_SEC")
+    if raw_value is None:
+        return _DEFAULT_WAL_CHECKPOINT_SECONDS
+
+    try:
+        interval = float(raw_value)
+    except ValueError:
+        interval = 0.0
+
+    if interval <= 0:
+        logger.warning(
+            "Invalid EMAIL_ASSISTANT_WAL_CHECKPOINT_SEC=%r; falling back to %.1fs",
+            raw_value,
+            _DEFAULT_WAL_CHECKPOINT_SECONDS,
+        )
+        return _DEFAULT_WAL_CHECKPOINT_SECONDS
+
+    return interval
+
+
+# Env-derived settings are read whenever a saver/store or pooled connection
+# is opened, so changes after import take effect; the rendered PRAGMA script
+# is memoised per (busy timeout, cache size).
+#
+# WAL + ``synchronous=NORMAL`` improve concurrency for parallel pytest runs /
+# LangSmith judges; ``temp_store`` and ``cache_size`` keep scratch b-trees and
+# hot pages in memory.
+@lru_cache(maxsize=8)
+def _pragma_script(busy_timeout_ms: int, cache_kb: int) -> str:
+    return (
+        "PRAGMA journal_mode=WAL;"
+        " PRAGMA synchronous=NORMAL;"
+        f" PRAGMA busy_timeout={busy_timeout_ms};"
+        " PRAGMA temp_store=MEMORY;"
+        # Negative cache_size values are interpreted by SQLite as KiB, not pages.
+        f" PRAGMA cache_size={-1 * cache_kb};"
+        # Long-lived connections: let SQLite refresh planner stats on open.
+        " PRAGMA optimize=0x10002;"
+        # Checkpoints run on a background thread (see _start_wal_checkpointer).
+        " PRAGMA wal_autocheckpoint=0;"
+    )
+
+
+def _apply_pragmas(conn: sqlite3.Connection, timeout_seconds: float) -> None:
+    """Configure a fresh connection with the shared PRAGMA script."""
+
+    conn.executescript(_pragma_script(int(timeout_seconds * 1000), _resolve_cache_kb()))
+
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    """Run ``PRAGMA optimize`` so the planner keeps fresh stats, then close."""
+
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        logger.debug("PRAGMA optimize failed during shutdown", exc_info=True)
+    finally:
+        conn.close()
+
+
+def _wal_checkpoint_loop(
+    path: Path, interval: float, timeout_seconds: float, stop: threading.Event
+) -> None:
+    """Run PASSIVE WAL checkpoints for ``path`` until ``stop`` is set."""
+
+    try:
+        # A dedicated connection keeps the checkpoint off the shared saver/store
+        # connection; PASSIVE mode never blocks concurrent readers or writers.
+        conn = sqlite3.connect(str(path), timeout=timeout_seconds)
+        try:
+            while not stop.wait(interval):
+                try:
+                    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                except sqlite3.Error:
+                    logger.debug("WAL checkpoint failed for %s", path, exc_info=True)
+        finally:
+            conn.close()
+    finally:
+        with _WAL_CHECKPOINT_LOCK:
+            entry = _WAL_CHECKPOINT_PATHS.get(path)
+            if entry is not None and entry[0] is stop:
+                del _WAL_CHECKPOINT_PATHS[path]
+
+
+def _start_wal_checkpointer(path: Path, timeout_seconds: float) -> threading.Event:
+    """Start (or share) the background checkpoint thread for ``path``.
+
+    Returns the path's stop event; pass it to :func:`_release_wal_checkpointer`
+    when the saver/store that requested it is closed.
+    """
+
+    with _WAL_CHECKPOINT_LOCK:
+        entry = _WAL_CHECKPOINT_PATHS.get(path)
+        if entry is not None:
+            entry[1] += 1
+            return entry[0]
+        stop = threading.Event()
+        _WAL_CHECKPOINT_PATHS[path] = [stop, 1]
+
+    threading.Thread(
+        target=_wal_checkpoint_loop,
+        args=(path, _resolve_wal_checkpoint_seconds(), timeout_seconds, stop),
+        name=f"sqlite-wal-checkpoint:{path.name}",
+        daemon=True,
+    ).start()
+    return stop
+
+
+def _release_wal_checkpointer(path: Path, stop: threading.Event) -> None:
+    """Drop one user of ``path``'s checkpoint thread, stopping it after the last."""
+
+    with _WAL_CHECKPOINT_LOCK:
+        entry = _WAL_CHECKPOINT_PATHS.get(path)
+        if entry is None or entry[0] is not stop:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _WAL_CHECKPOINT_PATHS[path]
+    stop.set()
+
+
+def _connect(
+    path: Path,
+    timeout_seconds: float,
+    *,
+    isolation_level: Optional[str] = "",
+) -> sqlite3.Connection:
+    """Open a configured connection to ``path``."""
+
+    conn = sqlite3.connect(
+        str(path),
+        check_same_thread=False,
+        timeout=timeout_seconds,
+        isolation_level=isolation_level,
+        cached_statements=_SQLITE_CACHED_STATEMENTS,
+    )
+    _apply_pragmas(conn, timeout_seconds)
+    return conn
+
+
+class _ThreadLocalConnection:
+    """Duck-typed ``sqlite3.Connection`` that gives each thread its own handle.
+
+    SqliteSaver serialises every call on one shared connection behind a single
+    lock. Installing :attr:`lease` as the saver lock instead binds a pooled
+    connection to the calling thread for the duration of each ``cursor()``
+    block, so parallel judges/pytest threads read the WAL database concurrently
+    while short-lived LangGraph executor threads reuse idle handles rather than
+    opening new ones. Access outside a lease (e.g. ``setup()``) goes to the
+    shared primary connection.
+    """
+
+    def __init__(self, path: Path, timeout_seconds: float) -> None:
+        self._path = path
+        self._timeout_seconds = timeout_seconds
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+        self._connections: list[sqlite3.Connection] = [_connect(path, timeout_seconds)]
+        self.lease = _ConnectionLease(self)
+
+    def _acquire(self) -> None:
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            with self._pool_lock:
+                if not self._connections:
+                    raise sqlite3.ProgrammingError("pool closed")
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = _connect(self._path, self._timeout_seconds)
+                with self._pool_lock:
+                    self._connections.append(conn)
+            self._local.conn = conn
+        self._local.depth = depth + 1
+
+    def _release(self) -> None:
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn = self._local.conn
+            self._local.conn = None
+            with self._pool_lock:
+                self._idle.append(conn)
+
+    def close(self) -> None:
+        with self._pool_lock:
+            connections, self._connections, self._idle = self._connections, [], []
+        for conn in connections:
+            _close_connection(conn)
+
+    def __getattr__(self, name: str) -> Any:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            connections = self._connections
+            if not connections:
+                raise sqlite3.ProgrammingError("pool closed")
+            conn = connections[0]
+        return getattr(conn, name)
+
+
+class _ConnectionLease:
+    """Reusable context manager binding a pooled connection to the current thread."""
+
+    def __init__(self, pool: _ThreadLocalConnection) -> None:
+        self._pool = pool
+
+    def __enter__(self) -> None:
+        self._pool._acquire()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._pool._release()
+
+
 @lru_cache(maxsize=4)
 def get_sqlite_checkpointer(path: Optional[str] = None) -> SqliteSaver:
     """Return a cached SqliteSaver configured for the requested path."""
 
     resolved_path = _resolve_path(path or os.getenv("EMAIL_ASSISTANT_CHECKPOINT_PATH"), _DEFAULT_CHECKPOINT_FILENAME)
     timeout_seconds = _resolve_timeout_seconds()
-    conn = sqlite3.connect(
-        str(resolved_path),
-        check_same_thread=False,
-        timeout=timeout_seconds,
-    )
-    # Improve concurrency for parallel pytest runs / LangSmith judges.
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout = %d" % int(timeout_seconds * 1000))
-    atexit.register(conn.close)
-    return SqliteSaver(conn)
+    conn = _ThreadLocalConnection(resolved_path, timeout_seconds)
+    wal_stop = _start_wal_checkpointer(resolved_path, timeout_seconds)
+    saver = SqliteSaver(conn)  # type: ignore[arg-type]
+    # Close once the saver is unreachable (e.g. evicted from the lru_cache) or
+    # at interpreter exit, without atexit pinning the connection forever.
+    weakref.finalize(saver, _release_wal_checkpointer, resolved_path, wal_stop)
+    weakref.finalize(saver, conn.close)
+    # Create tables once on the shared primary connection before handing out
+    # per-thread handles so concurrent first writes cannot race the DDL.
+    saver.setup()
+    saver.lock = conn.lease  # type: ignore[assignment]
+    return saver
 
 
 @lru_cache(maxsize=4)
@@ -97,18 +378,25 @@ def get_sqlite_store(path: Optional[str] = None) -> SqliteStore:
 
     resolved_path = _resolve_path(path or os.getenv("EMAIL_ASSISTANT_STORE_PATH"), _DEFAULT_STORE_FILENAME)
     timeout_seconds = _resolve_timeout_seconds()
-    conn = sqlite3.connect(
-        str(resolved_path),
-        check_same_thread=False,
-        timeout=timeout_seconds,
-    )
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout = %d" % int(timeout_seconds * 1000))
-    atexit.register(conn.close)
+    # SqliteStore wraps read-modify-write batches in a deferred BEGIN, which
+    # fails with SQLITE_BUSY (no busy-wait) when another connection holds the
+    # write lock, so the store keeps a single shared connection. It issues its
+    # own BEGIN/COMMIT, so autocommit mode (as SqliteStore.from_conn_string
+    # uses) avoids the driver's implicit transactions around every DML.
+    conn = _connect(resolved_path, timeout_seconds, isolation_level=None)
+    wal_stop = _start_wal_checkpointer(resolved_path, timeout_seconds)
     store = SqliteStore(conn)
+    weakref.finalize(store, _release_wal_checkpointer, resolved_path, wal_stop)
+    weakref.finalize(store, _close_connection, conn)
     disable_flag = os.getenv("LANGGRAPH_DISABLE_CUSTOM_CHECKPOINTER")
     if not (disable_flag and disable_flag.lower() not in ("0", "false", "no", "")):
-        store.setup()
+        if resolved_path in _INITIALIZED_STORE_PATHS and conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='store_migrations'"
+        ).fetchone():
+            store.is_setup = True
+        else:
+            store.setup()
+            _INITIALIZED_STORE_PATHS.add(resolved_path)
     return store
 
 
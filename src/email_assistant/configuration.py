@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-
-from langchain.chat_models import init_chat_model
+from functools import lru_cache
 
 _DEFAULT_MODEL = "gemini-2.5-pro"
 _DEFAULT_PROVIDER = "google_genai"
@@ -30,6 +29,7 @@ class ModelSpec:
         return f"{self.provider}:{self.model}" if self.provider else self.model
 
 
+@lru_cache(maxsize=1)
 def _default_model() -> str:
     """
     Selects the default model name for the assistant.
@@ -46,6 +46,7 @@ def _default_model() -> str:
     )
 
 
+@lru_cache(maxsize=1)
 def _default_provider() -> str:
     """
     Selects the default model provider for the email assistant.
@@ -58,6 +59,22 @@ def _default_provider() -> str:
     return os.environ.get("EMAIL_ASSISTANT_MODEL_PROVIDER", _DEFAULT_PROVIDER)
 
 
+def reset_model_cache() -> None:
+    """
+    Forget the cached model/provider defaults and normalised specs.
+    
+    Environment defaults are resolved once per process because `get_llm` runs on every
+    agent step. Call this after changing `EMAIL_ASSISTANT_MODEL`, `GEMINI_MODEL`, or
+    `EMAIL_ASSISTANT_MODEL_PROVIDER` at runtime (e.g. from tests) so the next lookup
+    re-reads the environment.
+    """
+
+    _default_model.cache_clear()
+    _default_provider.cache_clear()
+    normalize_model_spec.cache_clear()
+
+
+@lru_cache(maxsize=32)
 def normalize_model_spec(
     model: str | None = None,
     *,
@@ -142,6 +159,20 @@ def model_spec(model: str | None = None, *, provider: str | None = None) -> Mode
     return normalize_model_spec(model, model_provider=provider)
 
 
+def init_chat_model(model: str, **kwargs):
+    """
+    Initialise a chat model through LangChain's ``init_chat_model``.
+
+    The LangChain import chain costs several hundred milliseconds, so it is deferred
+    until a model is actually requested instead of being paid by every CLI run, cron
+    invocation, and test collection that merely imports this module.
+    """
+
+    from langchain.chat_models import init_chat_model as _init_chat_model
+
+    return _init_chat_model(model, **kwargs)
+
+
 def get_llm(temperature: float = 0.0, **kwargs):
     """
     Create a LangChain BaseChatModel configured for a Gemini chat model.
@@ -3,9 +3,6 @@ import sys
 import asyncio
 from typing import Dict, Any, TypedDict
 from dataclasses import dataclass, field
-from langgraph.graph import StateGraph, START, END
-from email_assistant.tools.gmail.run_ingest import fetch_and_process_emails
-from email_assistant.tracing import AGENT_PROJECT, init_project
 
 @dataclass(kw_only=True)
 class JobKickoff:
@@ -21,6 +18,10 @@ class JobKickoff:
 
 async def main(state: JobKickoff):
     """Run the email ingestion process"""
+    # Deferred so importing this module (tests, tooling) skips the Gmail/LangSmith import chain
+    from email_assistant.tools.gmail.run_ingest import fetch_and_process_emails
+    from email_assistant.tracing import AGENT_PROJECT, init_project
+
     init_project(AGENT_PROJECT)
     print(f"Kicking off job to fetch emails from the past {state.minutes_since} minutes")
     print(f"Email: {state.email}")
@@ -28,31 +29,10 @@ async def main(state: JobKickoff):
     print(f"Graph name: {state.graph_name}")
     
     try:
-        # Convert state to args object for fetch_and_process_emails
-        class Args:
-            def __init__(self, **kwargs):
-                for key, value in kwargs.items():
-                    setattr(self, key, value)
-                print(f"Created Args with attributes: {dir(self)}")
-        
-        args = Args(
-            email=state.email,
-            minutes_since=state.minutes_since,
-            graph_name=state.graph_name,
-            url=state.url,
-            include_read=state.include_read,
-            rerun=state.rerun,
-            early=state.early,
-            skip_filters=state.skip_filters
-        )
-        
-        # Print email and URL to verify they're being passed correctly
-        print(f"Args email: {args.email}")
-        print(f"Args url: {args.url}")
-        
-        # Run the ingestion process
+        # Run the ingestion process; fetch_and_process_emails only reads
+        # attributes, so the state dataclass stands in for the argparse namespace
         print("Starting fetch_and_process_emails...")
-        result = await fetch_and_process_emails(args)
+        result = await fetch_and_process_emails(state)
         print(f"fetch_and_process_emails returned: {result}")
         
         # Return the result status
@@ -63,8 +43,19 @@ async def main(state: JobKickoff):
         print(traceback.format_exc())
         return {"status": "error", "error": str(e)}
 
-# Build the graph
-graph = StateGraph(JobKickoff)
-graph.add_node("ingest_emails", main)
-graph.set_entry_point("ingest_emails")
-graph = graph.compile()
+def _build_graph():
+    """Build and compile the cron ingestion graph"""
+    from langgraph.graph import StateGraph
+
+    builder = StateGraph(JobKickoff)
+    builder.add_node("ingest_emails", main)
+    builder.set_entry_point("ingest_emails")
+    return builder.compile()
+
+def __getattr__(name):
+    """Compile the graph on first access (PEP 562) so importing stays cheap"""
+    if name == "graph":
+        global graph
+        graph = _build_graph()
+        return graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
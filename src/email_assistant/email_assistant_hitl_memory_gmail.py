@@ -1001,8 +1001,15 @@ def triage_router_task(
             reminder_actions = []
 
         update = dict(update)
-        cancel_actions = [a for a in reminder_actions if a.get("action") == "cancel"]
-        create_actions = [a for a in reminder_actions if a.get("action") == "create"]
+        # Partition in one pass over the collected actions.
+        cancel_actions: list[dict[str, Any]] = []
+        create_actions: list[dict[str, Any]] = []
+        for action in reminder_actions:
+            kind = action.get("action")
+            if kind == "cancel":
+                cancel_actions.append(action)
+            elif kind == "create":
+                create_actions.append(action)
 
         post_dispatch_target = goto
         dispatch_actions: list[dict[str, Any]] = []
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -19,6 +21,11 @@ from email_assistant.tracing import (
     invoke_with_root_run,
     prime_parent_run,
 )
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
 class CompositeJudgeResult(BaseModel):
     overall_score: float = Field(..., ge=0.0, le=1.0)
     verdict: str = Field(..., description="pass/fail based on weighted score")
@@ -26,6 +33,16 @@ class CompositeJudgeResult(BaseModel):
     notes: str = Field(default="", description="Summary of component contributions")
 
 
+def _resolve_weights(weights: Optional[Dict[str, float]]) -> Tuple[float, float, float]:
+    weights = weights or {"correctness": 0.6, "reminder": 0.4}
+    correct_w = weights.get("correctness", 0.6)
+    reminder_w = weights.get("reminder", 0.4)
+    total = correct_w + reminder_w
+    if total <= 0:
+        raise ValueError("Composite weights must be positive")
+    return correct_w, reminder_w, total
+
+
 def combine_judge_scores(
     correctness: JudgeResult,
     reminder: ReminderRunJudgeVerdict,
@@ -35,13 +52,7 @@ def combine_judge_scores(
 ) -> CompositeJudgeResult:
     """Combine correctness and reminder judges into a single weighted score."""
 
-    weights = weights or {"correctness": 0.6, "reminder": 0.4}
-    correct_w = weights.get("correctness", 0.6)
-    reminder_w = weights.get("reminder", 0.4)
-    total = correct_w + reminder_w
-    if total <= 0:
-        raise ValueError("Composite weights must be positive")
-
+    correct_w, reminder_w, total = _resolve_weights(weights)
     composite = (
         correctness.overall_correctness * correct_w + reminder.reminder_score * reminder_w
     ) / total
@@ -63,6 +74,31 @@ def combine_judge_scores(
     )
 
 
+def combine_judge_scores_batch(
+    correctness_arr: "np.ndarray",
+    reminder_arr: "np.ndarray",
+    *,
+    weights: Optional[Dict[str, float]] = None,
+    threshold: float = 0.70,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Vectorised composite for eval sweeps; returns ``(composite, passed)`` arrays.
+
+    Uses the same weighting as :func:`combine_judge_scores`, which stays scalar
+    because array setup outweighs the arithmetic for a single row. Needs numpy
+    (``pip install agents_from_scratch[eval]``).
+    """
+
+    import numpy as np
+
+    correct_w, reminder_w, total = _resolve_weights(weights)
+    composite = (
+        np.asarray(correctness_arr, dtype=float) * correct_w
+        + np.asarray(reminder_arr, dtype=float) * reminder_w
+    ) / total
+    return composite, composite >= threshold
+
+
+@lru_cache(maxsize=1)
 def _resolve_judge_project() -> str:
     for key in (
         "EMAIL_ASSISTANT_REMINDER_JUDGE_PROJECT_OVERRIDE",
@@ -76,6 +112,7 @@ def _resolve_judge_project() -> str:
     return JUDGE_PROJECT
 
 
+@lru_cache(maxsize=1)
 def _resolve_agent_project() -> str:
     override = os.getenv("EMAIL_ASSISTANT_REMINDER_AGENT_PROJECT")
     if override:
@@ -83,13 +120,33 @@ def _resolve_agent_project() -> str:
     return AGENT_PROJECT
 
 
+_LS_ENABLED: Optional[bool] = None
+
+
+def _langsmith_enabled() -> bool:
+    global _LS_ENABLED
+    if _LS_ENABLED is None:
+        _LS_ENABLED = bool(os.getenv("LANGSMITH_API_KEY"))
+    return _LS_ENABLED
+
+
+def refresh() -> None:
+    """Re-read project/LangSmith env vars on the next composite judge call."""
+
+    global _LS_ENABLED
+    _resolve_judge_project.cache_clear()
+    _resolve_agent_project.cache_clear()
+    _LS_ENABLED = None
+
+
 def _attach_composite_feedback(
     run_id: Optional[str],
     result: CompositeJudgeResult,
     *,
     email_markdown: Optional[str],
+    payload: Optional[Dict[str, Any]] = None,
 ) -> None:
-    if not os.getenv("LANGSMITH_API_KEY"):
+    if not _langsmith_enabled():
         return
 
     project = _resolve_agent_project()
@@ -106,7 +163,8 @@ def _attach_composite_feedback(
     if not client or not run_ids:
         return
 
-    payload = result.model_dump()
+    if payload is None:
+        payload = result.model_dump()
     comp = result.component_scores or {}
     correctness = comp.get("correctness")
     reminder_component = comp.get("reminder")
@@ -120,7 +178,7 @@ def _attach_composite_feedback(
         parts.append(f"reminder={reminder_component:.2f}")
     summary = "; ".join(parts)
 
-    for target in run_ids:
+    def _submit(target: str) -> None:
         try:
             client.create_feedback(
                 run_id=target,
@@ -131,7 +189,11 @@ def _attach_composite_feedback(
                 extra=payload,
             )
         except Exception:
-            continue
+            pass
+
+    # LangSmith has no bulk feedback endpoint, so overlap the per-target POSTs.
+    with ThreadPoolExecutor(max_workers=min(8, len(run_ids))) as pool:
+        pool.map(_submit, run_ids)
 
 
 def run_composite_judge(
@@ -155,6 +217,7 @@ def run_composite_judge(
         weights=weights,
         threshold=threshold,
     )
+    result_dump = result.model_dump()
 
     project = _resolve_judge_project()
     weights_payload = dict(weights or {"correctness": 0.6, "reminder": 0.4})
@@ -162,22 +225,23 @@ def run_composite_judge(
     created_records = reminder_created or []
     cleared_records = reminder_cleared or []
 
-    if email_input is not None:
-        email_payload = dict(email_input)
-    else:
-        email_payload = _reminder_input_payload(
-            sender_email or "",
-            created_records,
-            cleared_records,
-            email_markdown or "",
-            "",
-        )
-
     def _log_result() -> CompositeJudgeResult:
+        # Built only once the root run exists; prime_parent_run never mutates
+        # email_input, so the caller's mapping is passed through uncopied.
+        if email_input is not None:
+            email_payload = email_input
+        else:
+            email_payload = _reminder_input_payload(
+                sender_email or "",
+                created_records,
+                cleared_records,
+                email_markdown or "",
+                "",
+            )
         prime_parent_run(
             email_input=email_payload,
             email_markdown=email_markdown or "",
-            outputs=result.model_dump(),
+            outputs=result_dump,
             agent_label="judge:reminder:composite",
             tags=["reminder_judge"],
             metadata_update={
@@ -215,6 +279,7 @@ def run_composite_judge(
         parent_run_id,
         result,
         email_markdown=email_markdown,
+        payload=result_dump,
     )
 
     return result
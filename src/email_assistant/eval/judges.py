@@ -53,6 +53,7 @@ __all__ = [
     "create_langsmith_correctness_evaluator",
     "iter_experiment_runs",
     "resolve_feedback_targets",
+    "langsmith_client",
 ]
 
 
@@ -61,6 +62,19 @@ def _debug_judge(message: str, *args: Any) -> None:
         logger.debug(message, *args)
 
 
+@lru_cache(maxsize=1)
+def _cached_client(api_key: Optional[str]) -> Client:
+    """Return one LangSmith client per API key instead of one per judged run."""
+
+    return Client(api_key=api_key)
+
+
+def langsmith_client() -> Client:
+    """Return the shared LangSmith client for the current ``LANGSMITH_API_KEY``."""
+
+    return _cached_client(os.getenv("LANGSMITH_API_KEY"))
+
+
 class JudgeUnavailableError(RuntimeError):
     """Raised when the judge cannot be executed (e.g., config missing)."""
 
@@ -307,20 +321,27 @@ def serialise_messages(messages: Iterable[object]) -> str:
     """Serialize LangChain/primitive messages to JSON for judge context."""
 
     serialisable = []
+    append = serialisable.append
     for message in messages or []:
-        if hasattr(message, "model_dump"):
+        # Plain strings need no attribute probes.
+        if isinstance(message, str):
+            append(message)
+            continue
+        model_dump = getattr(message, "model_dump", None)
+        if model_dump is not None:
             try:
-                serialisable.append(message.model_dump())
+                append(model_dump())
                 continue
             except Exception:  # pragma: no cover - fall back
                 pass
-        if hasattr(message, "dict"):
+        as_dict = getattr(message, "dict", None)
+        if as_dict is not None:
             try:
-                serialisable.append(message.dict())  # type: ignore[attr-defined]
+                append(as_dict())
                 continue
             except Exception:  # pragma: no cover - fall back
                 pass
-        serialisable.append(str(message))
+        append(str(message))
 
     try:
         return json.dumps(serialisable, ensure_ascii=False)
@@ -545,7 +566,7 @@ def resolve_feedback_targets(
                 return None, []
             base_run_id = run_tree.id
         base_run_id = str(base_run_id)
-        client = Client()
+        client = langsmith_client()
     except LangSmithError as exc:
         _debug_judge("resolve_feedback_targets: failed to initialise LangSmith client: %s", exc)
         return None, []
@@ -1009,7 +1030,7 @@ def iter_experiment_runs(
         Iterator of LangSmith ``Run`` objects in dataset order.
     """
 
-    resolved_client = client or Client()
+    resolved_client = client or langsmith_client()
     kwargs: Dict[str, Any] = {"preview": preview}
     if experiment_name:
         kwargs["name"] = experiment_name
@@ -2,28 +2,115 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
+import logging
 import os
-from typing import Any, List, Literal, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, List, Literal, Optional, Sequence, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback to stdlib json
+    orjson = None
 
 from email_assistant.configuration import get_llm
 from email_assistant.eval.judges import JudgeUnavailableError, resolve_feedback_targets
 from email_assistant.tracing import (
-    AGENT_PROJECT,
     JUDGE_PROJECT,
+    ainvoke_with_root_run,
+    current_root_run_id,
     invoke_with_root_run,
     log_llm_child_run,
     prime_parent_run,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class ReminderRecord(TypedDict, total=False):
+    """Shape of the created/cleared reminder snapshots handed to the judge."""
+
+    thread_id: str
+    subject: str
+    recipient: str
+    to: str
+    due_at: str
+    reason: str
+    status: str
+
 
 class ReminderRunJudgeVerdict(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        validate_assignment=False,
+        revalidate_instances="never",
+        str_strip_whitespace=False,
+    )
+
     reminder_score: float = Field(..., ge=0.0, le=1.0, description="0-1 reminder safety score")
     verdict: Literal["pass", "fail"] = Field(..., description="Overall reminder decision")
     missing_controls: List[str] = Field(default_factory=list, description="Missing reminder safeguards")
-    notes: str = Field(..., description="<=300 character summary")
+    notes: str = Field(..., max_length=300, description="<=300 character summary")
+
+    @field_validator("notes", mode="before")
+    @classmethod
+    def _clip_notes(cls, value: Any) -> Any:
+        # Clip over-long LLM summaries instead of failing the whole verdict.
+        if isinstance(value, str) and len(value) > 300:
+            return value[:300]
+        return value
+
+
+# prime_parent_run only reads tags, so one shared tuple serves every call.
+_TAGS: tuple[str, ...] = ("reminder_judge",)
+
+# Verdicts returned when REMINDER_JUDGE_FORCE_DECISION is set; frozen, so one
+# shared instance per decision is safe to hand out.
+_FORCED_VERDICTS: dict[str, ReminderRunJudgeVerdict] = {
+    "approve": ReminderRunJudgeVerdict(
+        reminder_score=0.9,
+        verdict="pass",
+        missing_controls=[],
+        notes="Forced approval via REMINDER_JUDGE_FORCE_DECISION",
+    ),
+    "hitl": ReminderRunJudgeVerdict(
+        reminder_score=0.5,
+        verdict="fail",
+        missing_controls=["Manual review required"],
+        notes="Forced HITL decision via REMINDER_JUDGE_FORCE_DECISION",
+    ),
+    "reject": ReminderRunJudgeVerdict(
+        reminder_score=0.1,
+        verdict="fail",
+        missing_controls=["Reminder should be rejected"],
+        notes="Forced rejection via REMINDER_JUDGE_FORCE_DECISION",
+    ),
+    "": ReminderRunJudgeVerdict(
+        reminder_score=0.7,
+        verdict="pass",
+        missing_controls=[],
+        notes="Default forced reminder decision",
+    ),
+}
+
+
+# Returned without an LLM call when no reminders were created or cleared and
+# EMAIL_ASSISTANT_REMINDER_JUDGE_SKIP_EMPTY is enabled.
+_NOOP_VERDICT = ReminderRunJudgeVerdict(
+    reminder_score=1.0,
+    verdict="pass",
+    missing_controls=[],
+    notes="No reminder actions taken.",
+)
 
 
 PROMPT_TEMPLATE = """
@@ -45,7 +132,40 @@ Context:
 <reminder_cleared>{reminder_cleared}</reminder_cleared>
 """
 
+# Static instruction block of PROMPT_TEMPLATE; _build_prompt appends the
+# context tags directly instead of running the template through str.format.
+_PROMPT_PREFIX = PROMPT_TEMPLATE.split("<sender_email>", 1)[0]
+
 
+def _dumps(value: Any) -> str:
+    """Encode ``value`` as compact UTF-8 JSON, preferring orjson when installed."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _build_prompt(
+    sender_email: str,
+    email_markdown: str,
+    assistant_reply: str,
+    created_json: str,
+    cleared_json: str,
+) -> str:
+    return (
+        _PROMPT_PREFIX
+        + f"<sender_email>{sender_email or '(unknown)'}</sender_email>\n"
+        + f"<email_markdown>{email_markdown or '(email context unavailable)'}</email_markdown>\n"
+        + f"<assistant_reply>{assistant_reply or '(assistant reply unavailable)'}</assistant_reply>\n"
+        + f"<reminder_created>{created_json}</reminder_created>\n"
+        + f"<reminder_cleared>{cleared_json}</reminder_cleared>\n"
+    )
+
+
+@lru_cache(maxsize=1)
 def _resolve_reminder_project() -> str:
     """Return the LangSmith project name for reminder-judge traces."""
 
@@ -61,62 +181,128 @@ def _resolve_reminder_project() -> str:
     return JUDGE_PROJECT
 
 
-def _resolve_agent_project() -> str:
-    """Return the LangSmith project name for reminder feedback on agent runs."""
+# Target resolution + feedback POSTs run on this pool so the judge returns its
+# verdict without waiting on LangSmith; create_feedback retries 429/5xx itself
+# (honouring Retry-After) up to _FEEDBACK_ATTEMPTS times. Pending work is
+# flushed at interpreter exit.
+_FEEDBACK_ATTEMPTS = 3
+_BG = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reminder-judge-bg")
+atexit.register(_BG.shutdown, wait=True, cancel_futures=False)
+
+_TRUTHY = ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class ReminderJudgeConfig:
+    """Env-derived reminder judge settings, parsed once per process.
+
+    ``REMINDER_JUDGE_FORCE_DECISION`` is deliberately not part of the snapshot:
+    live reminder tests flip it between calls, so it is read per invocation.
+    """
+
+    llm_judge_enabled: bool
+    google_api_key: str
+    model_override: str
+    langsmith_enabled: bool
+    skip_empty: bool
+    cache_verdicts: bool
+
+    @classmethod
+    def from_env(cls) -> "ReminderJudgeConfig":
+        return cls(
+            llm_judge_enabled=os.getenv("EMAIL_ASSISTANT_LLM_JUDGE", "").lower() in _TRUTHY,
+            google_api_key=os.getenv("GOOGLE_API_KEY", ""),
+            model_override=os.getenv("EMAIL_ASSISTANT_REMINDER_JUDGE_MODEL", ""),
+            langsmith_enabled=bool(os.getenv("LANGSMITH_API_KEY")),
+            skip_empty=os.getenv("EMAIL_ASSISTANT_REMINDER_JUDGE_SKIP_EMPTY", "").lower() in _TRUTHY,
+            cache_verdicts=os.getenv("EMAIL_ASSISTANT_REMINDER_JUDGE_CACHE", "").lower() in _TRUTHY,
+        )
+
+
+@lru_cache(maxsize=1)
+def _config() -> ReminderJudgeConfig:
+    return ReminderJudgeConfig.from_env()
+
+
+def _langsmith_enabled() -> bool:
+    return _config().langsmith_enabled
+
+
+def _build_judge_llm(model_name: Optional[str]) -> Any:
+    """Return a new structured-output reminder judge runnable for ``model_name``."""
+
+    return get_llm(model=model_name).with_structured_output(ReminderRunJudgeVerdict)
+
+
+# Only the sync entry point reuses runnables: the Gemini async client binds to
+# the event loop it first runs on, so the async path builds one per call.
+@lru_cache(maxsize=8)
+def _get_judge_llm(model_name: Optional[str]) -> Any:
+    """Return the cached sync reminder judge runnable for ``model_name``."""
+
+    return _build_judge_llm(model_name)
+
+
+# LLM verdicts keyed by (model, BLAKE2b digest of the rendered prompt); only
+# consulted when EMAIL_ASSISTANT_REMINDER_JUDGE_CACHE is enabled so dataset
+# re-runs can skip Gemini for inputs already judged in this process.
+_VERDICT_CACHE: "OrderedDict[tuple[Optional[str], bytes], ReminderRunJudgeVerdict]" = OrderedDict()
+_VERDICT_CACHE_MAX = 1024
+# Judges run concurrently from worker threads; the get/move_to_end and
+# insert/evict pairs must not interleave.
+_VERDICT_CACHE_LOCK = threading.Lock()
 
-    override = os.getenv("EMAIL_ASSISTANT_REMINDER_AGENT_PROJECT")
-    if override:
-        return override
-    return AGENT_PROJECT
+
+def _reset_project_cache() -> None:
+    """Re-read project/LangSmith env vars on the next reminder judge call."""
+
+    _resolve_reminder_project.cache_clear()
+    _get_judge_llm.cache_clear()
+    _config.cache_clear()
 
 
 def _primary_thread_id(
-    created: List[dict], cleared: List[dict]
+    created: Sequence[ReminderRecord], cleared: Sequence[ReminderRecord]
 ) -> str | None:
-    for group in (created, cleared):
-        if not group:
-            continue
-        candidate = group[0].get("thread_id")
-        if candidate:
-            return str(candidate)
+    if created and (candidate := created[0].get("thread_id")):
+        return str(candidate)
+    if cleared and (candidate := cleared[0].get("thread_id")):
+        return str(candidate)
     return None
 
 
 def _reminder_input_payload(
     sender_email: str,
-    created: List[dict],
-    cleared: List[dict],
+    created: Sequence[ReminderRecord],
+    cleared: Sequence[ReminderRecord],
     email_markdown: str,
     assistant_reply: str,
 ) -> dict:
+    first: ReminderRecord = created[0] if created else {}
+    subject = (
+        first.get("subject")
+        or (cleared[0].get("subject") if cleared else "")
+        or (f"Reminder review for {sender_email}" if sender_email else "")
+    )
+    recipient = first.get("recipient") or first.get("to") or ""
+    thread_id = first.get("thread_id")
+
     payload: dict[str, Any] = {
         "from": sender_email or "",
         "body": email_markdown or assistant_reply or "",
     }
-
-    if created:
-        first = created[0]
-        subject = first.get("subject") or ""
-        recipient = first.get("recipient") or first.get("to") or ""
-        if subject:
-            payload.setdefault("subject", subject)
-        if recipient:
-            payload.setdefault("to", recipient)
-        if first.get("thread_id"):
-            payload.setdefault("thread_id", first.get("thread_id"))
-
-    if "subject" not in payload and cleared:
-        subject = cleared[0].get("subject")
-        if subject:
-            payload["subject"] = subject
-
-    if not payload.get("subject") and sender_email:
-        payload["subject"] = f"Reminder review for {sender_email}"
-
+    if subject:
+        payload["subject"] = subject
+    if recipient:
+        payload["to"] = recipient
+    if thread_id:
+        payload["thread_id"] = thread_id
     return payload
 
 
-def _reminder_input_summary(sender_email: str, created: List[dict], cleared: List[dict]) -> str:
+def _reminder_input_summary(
+    sender_email: str, created: Sequence[ReminderRecord], cleared: Sequence[ReminderRecord]
+) -> str:
     sender = sender_email or "(unknown sender)"
     return (
         f"sender={sender} | created={len(created)} | "
@@ -136,27 +322,26 @@ def _attach_feedback_to_agent(
     verdict: ReminderRunJudgeVerdict,
     *,
     email_markdown: Optional[str],
+    source_run_id: Optional[str] = None,
+    payload: Optional[dict[str, Any]] = None,
 ) -> None:
     """Attach reminder-judge feedback to the target agent run, if available."""
 
-    if not os.getenv("LANGSMITH_API_KEY"):
+    # Feedback is addressed by run id, so no project env needs to be set here;
+    # mutating os.environ from concurrent judges would race.
+    if not _langsmith_enabled():
         return
 
-    project = _resolve_agent_project()
-    if project:
-        os.environ.setdefault("LANGSMITH_PROJECT", project)
-        os.environ.setdefault("LANGCHAIN_PROJECT", project)
-
     try:
-        client, run_ids = resolve_feedback_targets(
-            run_id, email_markdown=email_markdown
-        )
-    except Exception:
+        client, run_ids = resolve_feedback_targets(run_id, email_markdown=email_markdown)
+    except Exception:  # noqa: BLE001
+        logger.warning("Reminder judge could not resolve feedback targets for run %s", run_id, exc_info=True)
         return
     if not client or not run_ids:
         return
 
-    payload = verdict.model_dump()
+    if payload is None:
+        payload = verdict.model_dump()
     missing = ", ".join(verdict.missing_controls) if verdict.missing_controls else "none"
     summary = (
         f"score={verdict.reminder_score:.2f}; verdict={verdict.verdict}; "
@@ -171,180 +356,311 @@ def _attach_feedback_to_agent(
                 score=verdict.reminder_score,
                 value=summary,
                 comment=verdict.notes,
+                source_run_id=source_run_id,
                 extra=payload,
+                stop_after_attempt=_FEEDBACK_ATTEMPTS,
             )
-        except Exception:
-            continue
+        except Exception:  # noqa: BLE001
+            logger.warning("Reminder judge feedback failed for run %s", target, exc_info=True)
 
 
-def run_reminder_run_judge(
+def _attach_feedback_in_background(
+    run_id: Optional[str],
+    verdict: ReminderRunJudgeVerdict,
     *,
-    email_markdown: str,
-    assistant_reply: str,
-    reminder_created: List[dict],
-    reminder_cleared: List[dict],
-    sender_email: str,
-    parent_run_id: Optional[str] = None,
-    model_name: Optional[str] = None,
-) -> ReminderRunJudgeVerdict:
-    """Run the reminder-specific judge and return its verdict."""
+    email_markdown: Optional[str],
+    source_run_id: Optional[str],
+    payload: Optional[dict[str, Any]],
+) -> None:
+    """Queue :func:`_attach_feedback_to_agent` on the background executor."""
 
-    judge_project = _resolve_reminder_project()
-    forced = os.getenv("REMINDER_JUDGE_FORCE_DECISION", "").lower()
-    if forced:
-        if forced == "approve":
-            verdict = ReminderRunJudgeVerdict(
-                reminder_score=0.9,
-                verdict="pass",
-                missing_controls=[],
-                notes="Forced approval via REMINDER_JUDGE_FORCE_DECISION",
-            )
-        elif forced == "hitl":
-            verdict = ReminderRunJudgeVerdict(
-                reminder_score=0.5,
-                verdict="fail",
-                missing_controls=["Manual review required"],
-                notes="Forced HITL decision via REMINDER_JUDGE_FORCE_DECISION",
-            )
-        elif forced == "reject":
-            verdict = ReminderRunJudgeVerdict(
-                reminder_score=0.1,
-                verdict="fail",
-                missing_controls=["Reminder should be rejected"],
-                notes="Forced rejection via REMINDER_JUDGE_FORCE_DECISION",
-            )
-        else:
-            verdict = ReminderRunJudgeVerdict(
-                reminder_score=0.7,
-                verdict="pass",
-                missing_controls=[],
-                notes="Default forced reminder decision",
-            )
+    if not _langsmith_enabled():
+        return
+    _BG.submit(
+        _attach_feedback_to_agent,
+        run_id,
+        verdict,
+        email_markdown=email_markdown,
+        source_run_id=source_run_id,
+        payload=payload,
+    )
 
-        def _log_forced() -> ReminderRunJudgeVerdict:
-            email_input_payload = _reminder_input_payload(
-                sender_email,
-                reminder_created,
-                reminder_cleared,
-                email_markdown,
-                assistant_reply,
-            )
-            prime_parent_run(
-                email_input=email_input_payload,
-                email_markdown=email_markdown,
-                outputs=json.dumps(verdict.model_dump()),
-                agent_label="judge:reminder:forced",
-                tags=["reminder_judge"],
-                metadata_update={
-                    "forced": True,
-                    "forced_decision": forced or "default",
-                    "sender_email": sender_email,
-                    "reminder_created": reminder_created,
-                    "reminder_cleared": reminder_cleared,
-                },
-                thread_id=_primary_thread_id(reminder_created, reminder_cleared),
-            )
-            return verdict
 
-        invoke_with_root_run(
-            _log_forced,
-            root_name="judge:reminder:forced",
-            input_summary=f"forced={forced or 'default'}",
-            metadata={"forced": True, "forced_decision": forced or "default"},
-            extra={
-                "reminder_created": reminder_created,
-                "reminder_cleared": reminder_cleared,
-                "sender_email": sender_email,
-            },
-            output_transform=_reminder_output_summary,
-            project_name=judge_project,
+@dataclass
+class _ReminderJudgeRun:
+    """Per-call state shared by the sync and async reminder judge entry points."""
+
+    email_markdown: str
+    assistant_reply: str
+    reminder_created: List[ReminderRecord]
+    reminder_cleared: List[ReminderRecord]
+    sender_email: str
+    parent_run_id: Optional[str]
+    model_name: Optional[str]
+    config: ReminderJudgeConfig = field(default_factory=_config)
+    # Judge root run id and the dumped verdict, captured inside the traced
+    # callable so feedback can reuse them instead of recomputing.
+    run_id: Optional[str] = None
+    payload: Optional[dict[str, Any]] = None
+    prompt_messages: list[dict[str, str]] = field(default_factory=list)
+    cache_key: Optional[tuple[Optional[str], bytes]] = None
+
+    def __post_init__(self) -> None:
+        self.project = _resolve_reminder_project()
+        self.email_input = _reminder_input_payload(
+            self.sender_email,
+            self.reminder_created,
+            self.reminder_cleared,
+            self.email_markdown,
+            self.assistant_reply,
         )
-        _attach_feedback_to_agent(
-            parent_run_id,
-            verdict,
-            email_markdown=email_markdown,
+        self.thread_id = _primary_thread_id(self.reminder_created, self.reminder_cleared)
+        self.input_summary = _reminder_input_summary(
+            self.sender_email, self.reminder_created, self.reminder_cleared
         )
-        return verdict
+        # ``or None`` collapses "" and None onto one cache entry.
+        self.resolved_model = self.model_name or self.config.model_override or None
+
+    def fixed_verdict(self) -> Optional[tuple[ReminderRunJudgeVerdict, dict[str, Any]]]:
+        """Return ``(verdict, root_kwargs)`` when no LLM call is needed."""
+
+        forced = os.getenv("REMINDER_JUDGE_FORCE_DECISION", "").lower()
+        if forced:
+            verdict = _FORCED_VERDICTS.get(forced, _FORCED_VERDICTS[""])
+            root_name = "judge:reminder:forced"
+            input_summary = f"forced={forced or 'default'}"
+            metadata: dict[str, Any] = {"forced": True, "forced_decision": forced or "default"}
+        elif self.config.skip_empty and not self.reminder_created and not self.reminder_cleared:
+            verdict = _NOOP_VERDICT
+            root_name = "judge:reminder:noop"
+            input_summary = self.input_summary
+            metadata = {"skipped": "no_reminder_actions"}
+        else:
+            return None
+        return verdict, {
+            "root_name": root_name,
+            "input_summary": input_summary,
+            "metadata": metadata,
+            "extra": {
+                "reminder_created": self.reminder_created,
+                "reminder_cleared": self.reminder_cleared,
+                "sender_email": self.sender_email,
+            },
+            "output_transform": _reminder_output_summary,
+            "project_name": self.project,
+        }
 
-    if os.getenv("EMAIL_ASSISTANT_LLM_JUDGE", "").lower() not in ("1", "true", "yes"):
-        raise JudgeUnavailableError("EMAIL_ASSISTANT_LLM_JUDGE disabled")
+    def record_fixed(
+        self, verdict: ReminderRunJudgeVerdict, root_kwargs: dict[str, Any]
+    ) -> ReminderRunJudgeVerdict:
+        """Trace a verdict that needs no LLM call under the current root run."""
 
-    if not os.getenv("GOOGLE_API_KEY"):
-        raise JudgeUnavailableError("GOOGLE_API_KEY missing – cannot evaluate reminders")
+        self.run_id = current_root_run_id()
+        self.payload = verdict.model_dump()
+        prime_parent_run(
+            email_input=self.email_input,
+            email_markdown=self.email_markdown,
+            outputs=verdict.model_dump_json(),
+            agent_label=root_kwargs["root_name"],
+            tags=_TAGS,
+            metadata_update={
+                **root_kwargs["metadata"],
+                "sender_email": self.sender_email,
+                "reminder_created": self.reminder_created,
+                "reminder_cleared": self.reminder_cleared,
+            },
+            thread_id=self.thread_id,
+        )
+        return verdict
 
-    payload = PROMPT_TEMPLATE.format(
-        sender_email=sender_email or "(unknown)",
-        email_markdown=email_markdown or "(email context unavailable)",
-        assistant_reply=assistant_reply or "(assistant reply unavailable)",
-        reminder_created=json.dumps(reminder_created, ensure_ascii=False) if reminder_created else "[]",
-        reminder_cleared=json.dumps(reminder_cleared, ensure_ascii=False) if reminder_cleared else "[]",
-    )
+    def prepare_llm(self) -> dict[str, Any]:
+        """Build the prompt and return root-run kwargs for an LLM-backed verdict."""
 
-    prompt_messages = [
-        {"role": "system", "content": "Return only the JSON object."},
-        {"role": "user", "content": payload},
-    ]
+        if not self.config.llm_judge_enabled:
+            raise JudgeUnavailableError("EMAIL_ASSISTANT_LLM_JUDGE disabled")
 
-    def _invoke(_: dict) -> ReminderRunJudgeVerdict:
-        llm = get_llm(model=model_name or os.getenv("EMAIL_ASSISTANT_REMINDER_JUDGE_MODEL") or None)
-        structured = llm.with_structured_output(ReminderRunJudgeVerdict)
-        return structured.invoke(prompt_messages)
+        if not self.config.google_api_key:
+            raise JudgeUnavailableError("GOOGLE_API_KEY missing – cannot evaluate reminders")
 
-    def _invoke_and_log() -> ReminderRunJudgeVerdict:
-        verdict_inner = _invoke({})
-        email_input_payload = _reminder_input_payload(
-            sender_email,
-            reminder_created,
-            reminder_cleared,
-            email_markdown,
-            assistant_reply,
+        # Encoded once for the prompt; tracing metadata keeps the raw lists.
+        created_json = _dumps(self.reminder_created) if self.reminder_created else "[]"
+        cleared_json = _dumps(self.reminder_cleared) if self.reminder_cleared else "[]"
+        payload = _build_prompt(
+            self.sender_email,
+            self.email_markdown,
+            self.assistant_reply,
+            created_json,
+            cleared_json,
         )
+        self.prompt_messages = [
+            {"role": "system", "content": "Return only the JSON object."},
+            {"role": "user", "content": payload},
+        ]
+        if self.config.cache_verdicts:
+            self.cache_key = (
+                self.resolved_model,
+                hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest(),
+            )
+
+        return {
+            "root_name": "judge:reminder",
+            "input_summary": self.input_summary,
+            "metadata": {
+                "sender_email": self.sender_email,
+                "reminder_created_count": len(self.reminder_created),
+                "reminder_cleared_count": len(self.reminder_cleared),
+            },
+            "extra": {
+                "reminder_created": self.reminder_created,
+                "reminder_cleared": self.reminder_cleared,
+                "email_markdown": self.email_markdown,
+                "assistant_reply": self.assistant_reply,
+            },
+            "output_transform": _reminder_output_summary,
+            "project_name": self.project,
+        }
+
+    def cached_verdict(self) -> Optional[ReminderRunJudgeVerdict]:
+        if self.cache_key is None:
+            return None
+        with _VERDICT_CACHE_LOCK:
+            cached = _VERDICT_CACHE.get(self.cache_key)
+            if cached is not None:
+                _VERDICT_CACHE.move_to_end(self.cache_key)
+        return cached
+
+    def record_llm(self, verdict: ReminderRunJudgeVerdict) -> ReminderRunJudgeVerdict:
+        """Cache and trace an LLM verdict under the current root run."""
+
+        if self.cache_key is not None:
+            with _VERDICT_CACHE_LOCK:
+                _VERDICT_CACHE[self.cache_key] = verdict
+                if len(_VERDICT_CACHE) > _VERDICT_CACHE_MAX:
+                    _VERDICT_CACHE.popitem(last=False)
+        self.payload = verdict_dump = verdict.model_dump()
         prime_parent_run(
-            email_input=email_input_payload,
-            email_markdown=email_markdown,
-            outputs=json.dumps(verdict_inner.model_dump()),
+            email_input=self.email_input,
+            email_markdown=self.email_markdown,
+            outputs=verdict.model_dump_json(),
             agent_label="judge:reminder",
-            tags=["reminder_judge"],
+            tags=_TAGS,
             metadata_update={
-                "sender_email": sender_email,
-                "reminder_created": reminder_created,
-                "reminder_cleared": reminder_cleared,
+                "sender_email": self.sender_email,
+                "reminder_created": self.reminder_created,
+                "reminder_cleared": self.reminder_cleared,
             },
-            thread_id=_primary_thread_id(reminder_created, reminder_cleared),
+            thread_id=self.thread_id,
         )
         log_llm_child_run(
-            prompt=prompt_messages,
-            response=verdict_inner.model_dump(),
+            prompt=self.prompt_messages,
+            response=verdict_dump,
             metadata_update={"judge": "reminder"},
         )
-        return verdict_inner
+        return verdict
 
-    try:
-        verdict = invoke_with_root_run(
-            _invoke_and_log,
-            root_name="judge:reminder",
-            input_summary=_reminder_input_summary(sender_email, reminder_created, reminder_cleared),
-            metadata={
-                "sender_email": sender_email,
-                "reminder_created_count": len(reminder_created),
-                "reminder_cleared_count": len(reminder_cleared),
-            },
-            extra={
-                "reminder_created": reminder_created,
-                "reminder_cleared": reminder_cleared,
-                "email_markdown": email_markdown,
-                "assistant_reply": assistant_reply,
-            },
-            output_transform=_reminder_output_summary,
-            project_name=judge_project,
+    def attach_feedback(self, verdict: ReminderRunJudgeVerdict) -> ReminderRunJudgeVerdict:
+        _attach_feedback_in_background(
+            self.parent_run_id,
+            verdict,
+            email_markdown=self.email_markdown,
+            source_run_id=self.run_id,
+            payload=self.payload,
         )
+        return verdict
+
+
+def run_reminder_run_judge(
+    *,
+    email_markdown: str,
+    assistant_reply: str,
+    reminder_created: List[ReminderRecord],
+    reminder_cleared: List[ReminderRecord],
+    sender_email: str,
+    parent_run_id: Optional[str] = None,
+    model_name: Optional[str] = None,
+) -> ReminderRunJudgeVerdict:
+    """Run the reminder-specific judge and return its verdict."""
+
+    run = _ReminderJudgeRun(
+        email_markdown=email_markdown,
+        assistant_reply=assistant_reply,
+        reminder_created=reminder_created,
+        reminder_cleared=reminder_cleared,
+        sender_email=sender_email,
+        parent_run_id=parent_run_id,
+        model_name=model_name,
+    )
+
+    fixed = run.fixed_verdict()
+    if fixed is not None:
+        verdict, root_kwargs = fixed
+        invoke_with_root_run(
+            lambda: run.record_fixed(verdict, root_kwargs),
+            **root_kwargs,
+        )
+        return run.attach_feedback(verdict)
+
+    root_kwargs = run.prepare_llm()
+
+    def _invoke_and_log() -> ReminderRunJudgeVerdict:
+        run.run_id = current_root_run_id()
+        verdict_inner = run.cached_verdict()
+        if verdict_inner is None:
+            verdict_inner = _get_judge_llm(run.resolved_model).invoke(run.prompt_messages)
+        return run.record_llm(verdict_inner)
+
+    try:
+        verdict = invoke_with_root_run(_invoke_and_log, **root_kwargs)
     except Exception as exc:  # noqa: BLE001
         raise JudgeUnavailableError(f"Reminder judge failed: {exc}") from exc
 
-    _attach_feedback_to_agent(
-        parent_run_id,
-        verdict,
+    return run.attach_feedback(verdict)
+
+
+async def run_reminder_run_judge_async(
+    *,
+    email_markdown: str,
+    assistant_reply: str,
+    reminder_created: List[ReminderRecord],
+    reminder_cleared: List[ReminderRecord],
+    sender_email: str,
+    parent_run_id: Optional[str] = None,
+    model_name: Optional[str] = None,
+) -> ReminderRunJudgeVerdict:
+    """Async reminder judge; gather several calls to overlap LLM latency."""
+
+    run = _ReminderJudgeRun(
         email_markdown=email_markdown,
+        assistant_reply=assistant_reply,
+        reminder_created=reminder_created,
+        reminder_cleared=reminder_cleared,
+        sender_email=sender_email,
+        parent_run_id=parent_run_id,
+        model_name=model_name,
     )
 
-    return verdict
+    fixed = run.fixed_verdict()
+    if fixed is not None:
+        verdict, root_kwargs = fixed
+
+        async def _log_fixed() -> ReminderRunJudgeVerdict:
+            return run.record_fixed(verdict, root_kwargs)
+
+        await ainvoke_with_root_run(_log_fixed, **root_kwargs)
+        return run.attach_feedback(verdict)
+
+    root_kwargs = run.prepare_llm()
+
+    async def _invoke_and_log() -> ReminderRunJudgeVerdict:
+        run.run_id = current_root_run_id()
+        verdict_inner = run.cached_verdict()
+        if verdict_inner is None:
+            verdict_inner = await _build_judge_llm(run.resolved_model).ainvoke(run.prompt_messages)
+        return run.record_llm(verdict_inner)
+
+    try:
+        verdict = await ainvoke_with_root_run(_invoke_and_log, **root_kwargs)
+    except Exception as exc:  # noqa: BLE001
+        raise JudgeUnavailableError(f"Reminder judge failed: {exc}") from exc
+
+    return run.attach_feedback(verdict)
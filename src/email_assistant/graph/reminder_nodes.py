@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 from typing import Any, Dict, List, Literal, Sequence
 
 from langgraph.func import task
@@ -17,6 +18,10 @@ from email_assistant.tools.reminders import ReminderStore, get_default_store
 logger = logging.getLogger(__name__)
 
 _DEFAULT_THREAD_KEY = "__default__"
+_ACTION_KINDS = frozenset({"cancel", "create"})
+# Process-wide backend shared by every run. Pending reminder actions are not
+# kept at module level: they travel per run in the ``reminder_*`` state channels
+# (and the ("reminders", "pending_actions") namespace of the graph store).
 _REMINDER_STORE: ReminderStore | None = None
 
 
@@ -37,26 +42,30 @@ def _get_store() -> ReminderStore:
 def _normalise_thread_id(thread_id: object) -> str:
     if not thread_id:
         return _DEFAULT_THREAD_KEY
-    return str(thread_id)
+    # Interned so store/dict lookups keyed by thread id hit pointer equality.
+    return sys.intern(thread_id if isinstance(thread_id, str) else str(thread_id))
 
 
 def resolve_thread_key(state: Dict[str, Any]) -> str:
     """Derive a stable reminder key from the current state."""
 
-    email_input = state.get("email_input") or {}
-    candidates = [
-        email_input.get("thread_id"),
-        email_input.get("threadId"),
-        email_input.get("gmail_thread_id"),
-        email_input.get("gmailThreadId"),
-        state.get("reminder_thread_id"),
-        email_input.get("id"),
-        state.get("thread_id"),
-    ]
-    for candidate in candidates:
-        if candidate:
-            return str(candidate)
-    return _DEFAULT_THREAD_KEY
+    # Short-circuit on the first populated key instead of reading every candidate.
+    email_input = state.get("email_input")
+    candidate = None
+    if email_input:
+        candidate = (
+            email_input.get("thread_id")
+            or email_input.get("threadId")
+            or email_input.get("gmail_thread_id")
+            or email_input.get("gmailThreadId")
+        )
+    if not candidate:
+        candidate = (
+            state.get("reminder_thread_id")
+            or (email_input.get("id") if email_input else None)
+            or state.get("thread_id")
+        )
+    return _normalise_thread_id(candidate)
 
 
 def stage_reminder_actions(
@@ -69,31 +78,30 @@ def stage_reminder_actions(
     """Normalise reminder actions prior to dispatch."""
 
     canonical_thread = _normalise_thread_id(thread_id)
-    staged: List[Dict[str, Any]] = []
+    # Normalise and deduplicate in one pass, appending straight to the result.
+    deduped: List[Dict[str, Any]] = []
+    seen: set[str] = set()
+    duplicates = 0
     for action in actions:
         if not isinstance(action, dict):
             continue
-        kind = str(action.get("action", "")).lower()
-        if kind not in {"cancel", "create"}:
+        kind = action.get("action")
+        # Non-string kinds (dicts, lists) are unhashable; reject them up front.
+        kind = kind.lower() if isinstance(kind, str) else None
+        if kind not in _ACTION_KINDS:
             continue
         payload = dict(action)
         payload["action"] = kind
         payload["thread_id"] = _normalise_thread_id(payload.get("thread_id") or canonical_thread)
-        staged.append(payload)
-
-    deduped: List[Dict[str, Any]] = []
-    seen: set[str] = set()
-    for payload in staged:
         fingerprint = json.dumps(payload, sort_keys=True, default=str)
         if fingerprint in seen:
+            duplicates += 1
             continue
         seen.add(fingerprint)
         deduped.append(payload)
 
-    if staged and len(deduped) != len(staged):
-        logger.debug(
-            "Deduplicated %d reminder action(s) for thread %s", len(staged) - len(deduped), canonical_thread
-        )
+    if duplicates:
+        logger.debug("Deduplicated %d reminder action(s) for thread %s", duplicates, canonical_thread)
 
     return {
         "reminder_actions": deduped,
@@ -190,9 +198,9 @@ def apply_reminder_actions_node_task(
             )
 
     target = _fallback_target()
+    # Staged actions already carry a canonical lower-case kind.
     has_create = any(
-        isinstance(action, dict) and str(action.get("action", "")).lower() == "create"
-        for action in actions
+        isinstance(action, dict) and action.get("action") == "create" for action in actions
     )
     if origin == "triage_hitl_response" and has_create:
         target = "response_agent"
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 import json
-import os
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Tuple
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback to stdlib json
+    orjson = None
 
 
 PROFILE_NAMESPACE = ("email_assistant", "sender_reputation")
@@ -27,6 +32,27 @@ _MONEY_KEYWORDS = [
     "bill",
     "due",
 ]
+# Single alternation scanned case-insensitively instead of one substring
+# search per keyword over a lower-cased copy of the message.
+_MONEY_RE = re.compile("|".join(map(re.escape, _MONEY_KEYWORDS)), re.IGNORECASE)
+
+
+# Parsed profile per store, keyed by id(store) and validated against the raw
+# JSON string so a changed (or recycled) store entry is always re-parsed.
+_PROFILE_CACHE: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+_PROFILE_CACHE_MAX = 64
+
+
+def _dumps(profile: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(profile).decode()
+    return json.dumps(profile)
+
+
+def _loads(raw: str | bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 @dataclass
@@ -40,49 +66,71 @@ class SenderAssessment:
 def _load_profile(store) -> Dict[str, Dict[str, Dict[str, str]]]:
     try:
         entry = store.get(PROFILE_NAMESPACE, PROFILE_KEY)
-        if entry and getattr(entry, "value", None):
-            return json.loads(entry.value)
+        raw = getattr(entry, "value", None) if entry else None
+        if raw:
+            cached = _PROFILE_CACHE.get(id(store))
+            if cached is not None and cached[0] == raw:
+                return cached[1]
+            profile = _loads(raw)
+            _cache_profile(store, raw, profile)
+            return profile
     except Exception:
         pass
     return {"known": {}, "flagged": {}}
 
 
+def _cache_profile(store, raw: str, profile: Dict[str, Any]) -> None:
+    if len(_PROFILE_CACHE) >= _PROFILE_CACHE_MAX and id(store) not in _PROFILE_CACHE:
+        _PROFILE_CACHE.clear()
+    _PROFILE_CACHE[id(store)] = (raw, profile)
+
+
 def _save_profile(store, profile: Dict[str, Dict[str, Dict[str, str]]]) -> None:
     try:
-        store.put(PROFILE_NAMESPACE, PROFILE_KEY, json.dumps(profile))
+        raw = _dumps(profile)
+        store.put(PROFILE_NAMESPACE, PROFILE_KEY, raw)
     except Exception:
-        pass
+        # The cached dict may hold unsaved mutations; force a re-parse next time.
+        _PROFILE_CACHE.pop(id(store), None)
+        return
+    _cache_profile(store, raw, profile)
 
 
 def _extract_email(address: str | None) -> str:
     if not address:
         return ""
-    match = re.search(r"<([^>]+)>", address)
-    if match:
-        return match.group(1).strip().lower()
+    lt = address.rfind("<")
+    gt = address.rfind(">")
+    if lt != -1 and gt > lt + 1:
+        return address[lt + 1 : gt].strip().lower()
     return address.strip().lower()
 
 
-def assess_sender(store, author: str | None, subject: str, body: str) -> SenderAssessment:
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def assess_sender(
+    store,
+    author: str | None,
+    subject: str,
+    body: str,
+    now_iso: str | None = None,
+) -> SenderAssessment:
     profile = _load_profile(store)
     email = _extract_email(author)
     if not email:
         return SenderAssessment(email="", status="unknown", risk_level="high", reason="Missing sender address")
 
-    now_iso = datetime.now(timezone.utc).isoformat()
     record = profile["known"].get(email) or profile["flagged"].get(email)
     status = record.get("status") if record else "new"
 
-    lower_subject = (subject or "").lower()
-    lower_body = (body or "").lower()
-    text = f"{lower_subject}\n{lower_body}"
-
     risk_level = "low"
     reason = "Known sender"
 
-    money_hit = any(keyword in text for keyword in _MONEY_KEYWORDS)
+    # Only new senders depend on the keyword scan, so known/flagged senders skip it.
     if status == "new":
-        if money_hit:
+        if _MONEY_RE.search(subject or "") or _MONEY_RE.search(body or ""):
             risk_level = "high"
             reason = "New sender requesting financial action"
         else:
@@ -94,17 +142,28 @@ def assess_sender(store, author: str | None, subject: str, body: str) -> SenderA
     else:
         reason = record.get("reason", "Known sender")
 
-    profile.setdefault("last_seen", {})[email] = now_iso
-    _save_profile(store, profile)
+    # last_seen only needs day resolution; skip the write when it would not change.
+    now_iso = now_iso or _now_iso()
+    last_seen = profile.setdefault("last_seen", {})
+    previous = last_seen.get(email)
+    if not previous or previous[:10] != now_iso[:10]:
+        last_seen[email] = now_iso
+        _save_profile(store, profile)
 
     return SenderAssessment(email=email, status=status, risk_level=risk_level, reason=reason)
 
 
-def note_sender(store, email: str, status: str, reason: str | None = None) -> None:
+def note_sender(
+    store,
+    email: str,
+    status: str,
+    reason: str | None = None,
+    now_iso: str | None = None,
+) -> None:
     if not email:
         return
     profile = _load_profile(store)
-    entry = {"status": status, "updated_at": datetime.now(timezone.utc).isoformat()}
+    entry = {"status": status, "updated_at": now_iso or _now_iso()}
     if reason:
         entry["reason"] = reason
     if status in {"trusted", "known"}:
@@ -122,12 +181,6 @@ def sender_exists(store, email: str) -> bool:
 
 
 def sender_profile_snapshot(store) -> Dict[str, Dict[str, Dict[str, str]]]:
-    return _load_profile(store)
-
+    # Deep copy so callers cannot mutate the cached profile.
+    return copy.deepcopy(_load_profile(store))
 
-def judge_disabled() -> bool:
-    forced = os.getenv("REMINDER_JUDGE_FORCE_DECISION")
-    if forced:
-        return False
-    use_llm = os.getenv("EMAIL_ASSISTANT_LLM_JUDGE", "").lower() in ("1", "true", "yes")
-    return not use_llm
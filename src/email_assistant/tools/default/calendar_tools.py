@@ -15,6 +15,8 @@ WEEKDAYS = [
     "saturday",
     "sunday",
 ]
+# Built once so weekday tokens resolve with a single dict lookup.
+_WEEKDAY_INDEX = {name: idx for idx, name in enumerate(WEEKDAYS)}
 
 def _get_local_tz() -> ZoneInfo:
     tz = os.getenv("TIMEZONE", "Australia/Sydney")
@@ -89,8 +91,8 @@ def _coerce_preferred_day(value: Any, fallback_start_time: int | None = None) ->
     wd_idx = None
     wd_next = False
     for i, tok in enumerate(tokens):
-        if tok in WEEKDAYS:
-            wd_idx = WEEKDAYS.index(tok)
+        if tok in _WEEKDAY_INDEX:
+            wd_idx = _WEEKDAY_INDEX[tok]
             wd_next = (i > 0 and tokens[i - 1] == "next") or (i + 1 < len(tokens) and tokens[i + 1] == "next")
             break
     if wd_idx is not None:
@@ -9,7 +9,9 @@ import base64
 import email.utils
 import json
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Iterator, Tuple
 from pathlib import Path
 from pydantic import Field, BaseModel
@@ -23,6 +25,29 @@ def _eval_mode_enabled() -> bool:
 
     return os.getenv("EMAIL_ASSISTANT_EVAL_MODE", "").lower() in ("1", "true", "yes")
 
+# Poll queries are rebuilt at most once per bucket of this many seconds.
+_QUERY_BUCKET_SECONDS = 30
+
+
+@lru_cache(maxsize=64)
+def _build_gmail_query(email_address: str, minutes_since: int, bucket: int, include_read: bool) -> str:
+    after = bucket * _QUERY_BUCKET_SECONDS - minutes_since * 60
+    query = f"(to:{email_address} OR from:{email_address}) after:{after}"
+    if not include_read:
+        query += " is:unread"
+    return query
+
+
+def build_gmail_query(email_address: str, minutes_since: int, include_read: bool = False) -> str:
+    """Return the Gmail search query for messages to/from ``email_address``.
+
+    The ``after:`` cutoff is rounded down to a 30 second bucket so repeated
+    polls with the same parameters reuse the cached string.
+    """
+
+    bucket = int(time.time()) // _QUERY_BUCKET_SECONDS
+    return _build_gmail_query(email_address, minutes_since, bucket, include_read)
+
 # Define paths for credentials and tokens
 _ROOT = Path(__file__).parent.absolute()
 _SECRETS_DIR = _ROOT / ".secrets"
@@ -276,22 +301,14 @@ def fetch_group_emails(
             
         service = build("gmail", "v1", credentials=creds)
         
-        # Calculate timestamp for filtering
-        after = int((datetime.now() - timedelta(minutes=minutes_since)).timestamp())
-        
         # Construct Gmail search query
         # This query searches for:
         # - Emails sent to or from the specified address
         # - Emails after the specified timestamp
         # - Including emails from all categories (inbox, updates, promotions, etc.)
-        
-        # Base query with time filter
-        query = f"(to:{email_address} OR from:{email_address}) after:{after}"
-        
-        # Only include unread emails unless include_read is True
-        if not include_read:
-            query += " is:unread"
-        else:
+        # - Only unread emails unless include_read is True
+        query = build_gmail_query(email_address, minutes_since, include_read)
+        if include_read:
             logger.debug("Including read emails in search")
             
         # Log the final query for debugging
@@ -6,13 +6,14 @@ This script provides a minimal implementation for ingesting emails to the LangGr
 with reliable LangSmith tracing.
 """
 
-import base64
+import binascii
 import json
 import uuid
 import hashlib
 import asyncio
 import argparse
 import os
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from google.oauth2.credentials import Credentials
@@ -27,36 +28,37 @@ _ROOT = Path(__file__).parent.absolute()
 _SECRETS_DIR = _ROOT / ".secrets"
 TOKEN_PATH = _SECRETS_DIR / "token.json"
 
+# Map Gmail's urlsafe alphabet onto standard base64 so binascii can decode directly
+_URLSAFE_TRANS = bytes.maketrans(b"-_", b"+/")
+
 def extract_message_part(payload):
     """Extract content from a message part."""
-    # If this is multipart, process with preference for text/plain
-    if payload.get("parts"):
-        # First try to find text/plain part
-        for part in payload["parts"]:
-            mime_type = part.get("mimeType", "")
-            if mime_type == "text/plain" and part.get("body", {}).get("data"):
-                data = part["body"]["data"]
-                return base64.urlsafe_b64decode(data).decode("utf-8")
-                
-        # If no text/plain found, try text/html
-        for part in payload["parts"]:
-            mime_type = part.get("mimeType", "")
-            if mime_type == "text/html" and part.get("body", {}).get("data"):
-                data = part["body"]["data"]
-                return base64.urlsafe_b64decode(data).decode("utf-8")
-                
-        # If we still haven't found content, recursively check for nested parts
-        for part in payload["parts"]:
-            content = extract_message_part(part)
-            if content:
-                return content
-    
-    # Not multipart, try to get content directly
-    if payload.get("body", {}).get("data"):
-        data = payload["body"]["data"]
-        return base64.urlsafe_b64decode(data).decode("utf-8")
+    # Walk the MIME tree breadth-first once, preferring text/plain, then
+    # text/html, then the first other part carrying data; decode only the winner
+    plain = html = other = None
+    queue = deque([payload])
+    while queue:
+        part = queue.popleft()
+        if part.get("parts"):
+            queue.extend(part["parts"])
+            continue
+        data = part.get("body", {}).get("data")
+        if not data:
+            continue
+        mime_type = part.get("mimeType", "")
+        if mime_type == "text/plain":
+            plain = data
+            break
+        if mime_type == "text/html":
+            html = html or data
+        else:
+            other = other or data
 
-    return ""
+    data = plain or html or other
+    if not data:
+        return ""
+    raw = data.encode("ascii").translate(_URLSAFE_TRANS)
+    return binascii.a2b_base64(raw).decode("utf-8", errors="replace")
 
 def load_gmail_credentials():
     """
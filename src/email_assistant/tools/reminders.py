@@ -7,6 +7,7 @@ This module provides:
 
 Environment variables used:
 - `REMINDER_DB_PATH` (default: `.local/reminders.db`)
+- `EMAIL_ASSISTANT_TEST_FAST_SQLITE` (tests only: relax durability on `:memory:` stores)
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ import sqlite3
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional, Sequence
 
 
@@ -94,10 +96,39 @@ class ReminderStore(abc.ABC):
 # ------------------------
 
 
+# Durability is meaningless for a private in-memory database; the test suite
+# opts in to dropping journal/lock bookkeeping via EMAIL_ASSISTANT_TEST_FAST_SQLITE.
+_FAST_MEMORY_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY;"
+    "PRAGMA synchronous=OFF;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA locking_mode=EXCLUSIVE;"
+    "PRAGMA cache_size=-20000;"
+)
+
+# Maximum thread ids bound into a single ``IN (...)`` lookup.
+_IN_CHUNK_SIZE = 500
+
+
+def _fast_memory_sqlite() -> bool:
+    return os.getenv("EMAIL_ASSISTANT_TEST_FAST_SQLITE", "").lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_cached(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, memoised for repeated due/created stamps.
+
+    ``fromisoformat`` accepts a trailing ``Z`` natively on Python 3.11+.
+    """
+    return datetime.fromisoformat(value)
+
+
 class SqliteReminderStore(ReminderStore):
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or os.getenv("REMINDER_DB_PATH", ".local/reminders.db")
         self._connection: Optional[sqlite3.Connection] = None
+        # Every public method calls setup(); only run the DDL once per store.
+        self._schema_ready = False
         # Ensure directory exists for file-based dbs
         if self.db_path != ":memory:":
             os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
@@ -108,12 +139,16 @@ class SqliteReminderStore(ReminderStore):
             if self._connection is None:
                 self._connection = sqlite3.connect(":memory:", check_same_thread=False)
                 self._connection.row_factory = sqlite3.Row
+                if _fast_memory_sqlite():
+                    self._connection.executescript(_FAST_MEMORY_PRAGMAS)
             return self._connection
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
     def setup(self) -> None:
+        if self._schema_ready:
+            return
         with self._connect() as conn:
             conn.execute(
                 """
@@ -133,6 +168,7 @@ class SqliteReminderStore(ReminderStore):
             conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_thread ON reminders(thread_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders(due_at)")
             conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_active_reminder ON reminders(thread_id) WHERE canceled_at IS NULL AND notified_at IS NULL")
+        self._schema_ready = True
 
     def add_reminder(
         self,
@@ -197,35 +233,74 @@ class SqliteReminderStore(ReminderStore):
         cancelled: Dict[str, int] = {}
         created: Dict[str, str] = {}
 
+        # Partition once; each bucket keeps the resolved thread id alongside the action.
+        cancels: List[str] = []
+        creates: List[tuple[str, Dict[str, object]]] = []
+        for action in actions:
+            if not isinstance(action, dict):
+                continue
+            kind = str(action.get("action", "")).lower()
+            if kind not in ("cancel", "create"):
+                continue
+            thread_id = str(action.get("thread_id") or "").strip()
+            if not thread_id:
+                continue
+            if kind == "cancel":
+                cancels.append(thread_id)
+            else:
+                creates.append((thread_id, action))
+
         with self._connect() as conn:
             try:
                 # Cancels first to avoid duplicate reminders when recreating
-                for action in actions:
-                    if not isinstance(action, dict):
-                        continue
-                    if str(action.get("action", "")).lower() != "cancel":
-                        continue
-                    thread_id = str(action.get("thread_id") or "").strip()
-                    if not thread_id:
-                        continue
-                    count = self._cancel_reminder(conn, thread_id)
-                    if count:
-                        cancelled[thread_id] = cancelled.get(thread_id, 0) + count
-
-                for action in actions:
-                    if not isinstance(action, dict):
-                        continue
-                    if str(action.get("action", "")).lower() != "create":
-                        continue
-                    thread_id = str(action.get("thread_id") or "").strip()
-                    if not thread_id:
-                        continue
-                    subject = str(action.get("subject") or "(no subject)")
-                    due_at = self._ensure_datetime(action.get("due_at"))
-                    reason = str(action.get("reason") or "Reminder created via dispatcher")
-                    reminder_id = self._add_reminder(conn, thread_id, subject, due_at, reason)
-                    if reminder_id:
-                        created[thread_id] = reminder_id
+                if cancels:
+                    active = self._active_by_thread(conn, cancels)
+                    if active:
+                        now_iso = self._now_iso()
+                        conn.executemany(
+                            "UPDATE reminders SET status = 'canceled', canceled_at = ? WHERE thread_id = ? AND canceled_at IS NULL AND notified_at IS NULL",
+                            [(now_iso, thread_id) for thread_id in active],
+                        )
+                        for thread_id in active:
+                            cancelled[thread_id] = 1
+
+                if creates:
+                    existing = self._active_by_thread(conn, [thread_id for thread_id, _ in creates])
+                    rows = []
+                    for thread_id, action in creates:
+                        if thread_id in existing:
+                            if thread_id not in created:
+                                print(f"INFO: Active reminder already exists for thread {thread_id}.")
+                            created[thread_id] = existing[thread_id]
+                            continue
+                        reminder_id = str(uuid.uuid4())
+                        existing[thread_id] = created[thread_id] = reminder_id
+                        rows.append(
+                            (
+                                reminder_id,
+                                thread_id,
+                                str(action.get("subject") or "(no subject)"),
+                                self._to_iso(self._ensure_datetime(action.get("due_at"))),
+                                str(action.get("reason") or "Reminder created via dispatcher"),
+                                self._now_iso(),
+                            )
+                        )
+                    if rows:
+                        try:
+                            conn.executemany(
+                                "INSERT INTO reminders (id, thread_id, subject, due_at, reason, status, created_at) VALUES (?, ?, ?, ?, ?, 'pending', ?)",
+                                rows,
+                            )
+                        except sqlite3.IntegrityError:
+                            # A concurrent writer won a thread; settle the batch row by row.
+                            for reminder_id, thread_id, subject, due_iso, reason, _ in rows:
+                                found = self._add_reminder(
+                                    conn, thread_id, subject, _parse_iso_cached(due_iso), reason
+                                )
+                                if found:
+                                    created[thread_id] = found
+                                else:
+                                    created.pop(thread_id, None)
             except Exception:
                 conn.rollback()
                 raise
@@ -245,9 +320,7 @@ class SqliteReminderStore(ReminderStore):
     def _parse_iso(s: Optional[str]) -> Optional[datetime]:
         if not s:
             return None
-        if s.endswith("Z"):
-            s = s.replace("Z", "+00:00")
-        return datetime.fromisoformat(s)
+        return _parse_iso_cached(s)
 
     @staticmethod
     def _now_iso() -> str:
@@ -270,14 +343,13 @@ class SqliteReminderStore(ReminderStore):
         if isinstance(value, datetime):
             dt = value
         elif isinstance(value, str):
-            val = value.strip()
+            # isoformat() output has no surrounding whitespace; only copy when it does.
+            val = value.strip() if value and (value[0].isspace() or value[-1].isspace()) else value
             if not val:
                 dt = datetime.now(timezone.utc)
             else:
-                if val.endswith("Z"):
-                    val = val[:-1] + "+00:00"
                 try:
-                    dt = datetime.fromisoformat(val)
+                    dt = _parse_iso_cached(val)
                 except ValueError:
                     dt = datetime.now(timezone.utc)
         else:
@@ -287,6 +359,22 @@ class SqliteReminderStore(ReminderStore):
             return dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(timezone.utc)
 
+    @staticmethod
+    def _active_by_thread(conn: sqlite3.Connection, thread_ids: Sequence[str]) -> Dict[str, str]:
+        """Map each thread id with an active reminder to that reminder's id."""
+        unique = list(dict.fromkeys(thread_ids))
+        active: Dict[str, str] = {}
+        # Chunked to stay well under SQLite's bound-parameter limit.
+        for start in range(0, len(unique), _IN_CHUNK_SIZE):
+            chunk = unique[start : start + _IN_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT thread_id, id FROM reminders WHERE thread_id IN ({placeholders}) AND canceled_at IS NULL AND notified_at IS NULL",
+                chunk,
+            ).fetchall()
+            active.update((row["thread_id"], row["id"]) for row in rows)
+        return active
+
     def _cancel_reminder(self, conn: sqlite3.Connection, thread_id: str) -> int:
         cur = conn.execute(
             "UPDATE reminders SET status = 'canceled', canceled_at = ? WHERE thread_id = ? AND canceled_at IS NULL AND notified_at IS NULL",
@@ -10,7 +10,7 @@ from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import update_wrapper
-from typing import Any, Callable, Iterable, Mapping, Sequence as SeqType
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Sequence as SeqType
 
 from datetime import datetime, timezone
 
@@ -1166,6 +1166,56 @@ def invoke_with_root_run(
         ctx.__exit__(None, None, None)
 
 
+async def ainvoke_with_root_run(
+    func: Callable[[], Awaitable[Any]],
+    *,
+    root_name: str,
+    input_summary: str,
+    metadata: Mapping[str, Any] | None = None,
+    extra: Mapping[str, Any] | None = None,
+    output_transform: Callable[[Any], str | None] | None = None,
+    project_name: str | None = None,
+) -> Any:
+    """Async counterpart of :func:`invoke_with_root_run` for coroutine work."""
+
+    tags = default_trace_tags()
+
+    ctx, run = _start_langsmith_run(
+        root_name,
+        run_type="chain",
+        inputs_summary=input_summary,
+        metadata=metadata,
+        extra=extra,
+        tags=tags,
+        project_name=project_name,
+    )
+
+    if ctx is None or run is None:
+        return await func()
+
+    root_token = _ROOT_RUN_TREE.set(run)
+
+    try:
+        result = await func()
+        outputs_summary = None
+        if output_transform is not None:
+            try:
+                outputs_summary = output_transform(result)
+            except Exception:
+                outputs_summary = None
+        if outputs_summary is not None:
+            run.end(outputs={"summary": _grid_text(outputs_summary)})
+        else:
+            run.end()
+        return result
+    except Exception as exc:
+        run.end(error=_grid_text(str(exc)))
+        raise
+    finally:
+        _ROOT_RUN_TREE.reset(root_token)
+        ctx.__exit__(None, None, None)
+
+
 def format_final_output(state: Mapping[str, Any]) -> str:
     """Return a two-line plain-text summary for LangSmith Outputs."""
 
@@ -1235,6 +1285,7 @@ __all__ = [
     "log_tool_child_run",
     "log_llm_child_run",
     "invoke_with_root_run",
+    "ainvoke_with_root_run",
     "format_final_output",
     "trace_stage",
     "TraceRunHandle",
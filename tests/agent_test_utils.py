@@ -98,6 +98,24 @@ def load_dataset(agent_module_name: str) -> Tuple[List, List, List, List, List]:
     )
 
 
+def build_thread_config() -> Dict[str, Any]:
+    """Return a fresh per-run config (new ``run_id`` and ``thread_id``) for a compiled agent."""
+
+    run_id = str(uuid.uuid4())
+    thread_id = f"thread-{uuid.uuid4()}"
+    configurable_context: Dict[str, Any] = {
+        "thread_id": thread_id,
+        "thread_metadata": {"thread_id": thread_id},
+        "timezone": DEFAULT_TEST_TIMEZONE,
+        "eval_mode": is_eval_mode(),
+    }
+    return {
+        "run_id": run_id,
+        "configurable": configurable_context,
+        "recursion_limit": 100,
+    }
+
+
 def compile_agent(agent_module_name: str) -> Tuple[Any, Dict[str, Any], Optional[InMemoryStore], Any]:
     """
     Compile the agent module's workflow and prepare per-run runtime artifacts for testing.
@@ -115,19 +133,7 @@ def compile_agent(agent_module_name: str) -> Tuple[Any, Dict[str, Any], Optional
 
     checkpointer = MemorySaver()
     store: Optional[InMemoryStore] = InMemoryStore()
-    run_id = str(uuid.uuid4())
-    thread_id = f"thread-{uuid.uuid4()}"
-    configurable_context: Dict[str, Any] = {
-        "thread_id": thread_id,
-        "thread_metadata": {"thread_id": thread_id},
-        "timezone": DEFAULT_TEST_TIMEZONE,
-        "eval_mode": is_eval_mode(),
-    }
-    thread_config = {
-        "run_id": run_id,
-        "configurable": configurable_context,
-        "recursion_limit": 100,
-    }
+    thread_config = build_thread_config()
 
     if agent_module_name in {"email_assistant_hitl_memory", "email_assistant_hitl_memory_gmail"}:
         email_assistant = (
@@ -9,11 +9,18 @@ import pytest
 
 project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(src_path))
+# pyproject's pytest pythonpath normally covers this; only fall back when the
+# tests run without that config, and never add duplicate entries.
+_existing_paths = set(sys.path)
+for _path in (str(project_root), str(src_path)):
+    if _path not in _existing_paths:
+        sys.path.insert(0, _path)
 
 from email_assistant.tracing import AGENT_PROJECT, JUDGE_PROJECT, init_project
 
+# In-memory reminder stores skip journaling/fsync bookkeeping under test.
+os.environ.setdefault("EMAIL_ASSISTANT_TEST_FAST_SQLITE", "1")
+
 
 @pytest.fixture(autouse=True)
 def configure_langsmith_projects(monkeypatch):
@@ -53,8 +60,20 @@ def pytest_addoption(parser):
         "--agent-module",
         action="store",
         default="email_assistant_hitl_memory_gmail",
-        help="Specify which email assistant module to test",
-    )
+        help="Specify which email assistant module to test",
+    )
+    parser.addoption(
+        "--no-live-judge",
+        action="store_true",
+        default=False,
+        help="Skip the LLM judge phase of live tests (sets PYTEST_SKIP_LIVE_JUDGE=1)",
+    )
+
+
+def pytest_configure(config):
+    """Export `--no-live-judge` before test modules import and read it."""
+    if config.getoption("--no-live-judge"):
+        os.environ["PYTEST_SKIP_LIVE_JUDGE"] = "1"
 
 
 @pytest.fixture(scope="session")
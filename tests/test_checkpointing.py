@@ -0,0 +1,207 @@
+"""Tests for the SQLite checkpointer/store helpers."""
+
+from __future__ import annotations
+
+import gc
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from email_assistant import checkpointing
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def _checkpoint_threads(path: Path) -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == f"sqlite-wal-checkpoint:{path.name}"]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sqlite_caches():
+    checkpointing.get_sqlite_checkpointer.cache_clear()
+    checkpointing.get_sqlite_store.cache_clear()
+    yield
+    checkpointing.get_sqlite_checkpointer.cache_clear()
+    checkpointing.get_sqlite_store.cache_clear()
+    gc.collect()
+
+
+def test_wal_checkpointer_keeps_wal_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EMAIL_ASSISTANT_WAL_CHECKPOINT_SEC", "0.05")
+    db_path = tmp_path / "wal.sqlite"
+    wal_path = Path(f"{db_path}-wal")
+    conn = checkpointing._connect(db_path, 5.0)
+    conn.execute("CREATE TABLE blobs (data BLOB)")
+    conn.commit()
+    stop = checkpointing._start_wal_checkpointer(db_path, 5.0)
+
+    def _write_batch() -> None:
+        for _ in range(50):
+            conn.execute("INSERT INTO blobs VALUES (randomblob(4096))")
+        conn.commit()
+
+    try:
+        _write_batch()
+        first_size = wal_path.stat().st_size
+        for _ in range(3):
+            # Several checkpoint intervals: once every frame is copied back,
+            # the next writer restarts the WAL instead of appending to it.
+            time.sleep(0.3)
+            _write_batch()
+
+        # With wal_autocheckpoint=0 and no checkpointer, four batches would
+        # leave the WAL roughly four times the size of the first one.
+        assert wal_path.stat().st_size <= first_size * 1.5
+    finally:
+        checkpointing._release_wal_checkpointer(db_path, stop)
+        conn.close()
+
+
+def test_wal_checkpointer_stops_after_last_release(tmp_path: Path) -> None:
+    db_path = tmp_path / "release.sqlite"
+    sqlite3.connect(str(db_path)).close()
+
+    first = checkpointing._start_wal_checkpointer(db_path, 5.0)
+    second = checkpointing._start_wal_checkpointer(db_path, 5.0)
+    assert first is second
+    assert len(_checkpoint_threads(db_path)) == 1
+
+    checkpointing._release_wal_checkpointer(db_path, first)
+    assert not first.is_set()
+    assert db_path in checkpointing._WAL_CHECKPOINT_PATHS
+
+    checkpointing._release_wal_checkpointer(db_path, first)
+    assert first.is_set()
+    assert _wait_for(lambda: not _checkpoint_threads(db_path))
+    assert db_path not in checkpointing._WAL_CHECKPOINT_PATHS
+
+
+def test_closing_saver_stops_its_wal_checkpointer(tmp_path: Path) -> None:
+    db_path = tmp_path / "saver.sqlite"
+    saver = checkpointing.get_sqlite_checkpointer(str(db_path))
+    assert _checkpoint_threads(db_path)
+
+    checkpointing.get_sqlite_checkpointer.cache_clear()
+    del saver
+    gc.collect()
+
+    assert _wait_for(lambda: not _checkpoint_threads(db_path))
+    assert db_path not in checkpointing._WAL_CHECKPOINT_PATHS
+
+
+def test_pooled_saver_handles_concurrent_put_and_get(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+
+    saver = checkpointing.get_sqlite_checkpointer(str(tmp_path / "concurrent.sqlite"))
+
+    def _roundtrip(index: int) -> str:
+        config = {"configurable": {"thread_id": f"thread-{index}", "checkpoint_ns": ""}}
+        checkpoint = create_checkpoint(empty_checkpoint(), None, index)
+        saved = saver.put(config, checkpoint, {"step": index}, {})
+        loaded = saver.get_tuple(saved)
+        assert loaded is not None
+        return loaded.checkpoint["id"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(_roundtrip, range(32)))
+
+    assert len(set(ids)) == 32
+    for index in range(32):
+        config = {"configurable": {"thread_id": f"thread-{index}", "checkpoint_ns": ""}}
+        assert saver.get_tuple(config).metadata["step"] == index
+
+
+def test_nested_lease_returns_connection_to_idle(tmp_path: Path) -> None:
+    pool = checkpointing._ThreadLocalConnection(tmp_path / "lease.sqlite", 5.0)
+    try:
+        with pool.lease:
+            leased = pool._local.conn
+            with pool.lease:
+                assert pool._local.conn is leased
+                assert leased not in pool._idle
+            # The outer lease still holds the handle after the inner one exits.
+            assert pool._local.conn is leased
+            assert leased not in pool._idle
+        assert pool._local.conn is None
+        assert pool._idle == [leased]
+
+        with pool.lease:
+            assert pool._local.conn is leased
+    finally:
+        pool.close()
+
+
+def test_pool_attribute_access_after_close_raises(tmp_path: Path) -> None:
+    pool = checkpointing._ThreadLocalConnection(tmp_path / "closed.sqlite", 5.0)
+    pool.close()
+
+    with pytest.raises(sqlite3.ProgrammingError, match="pool closed"):
+        pool.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError, match="pool closed"):
+        with pool.lease:
+            pass
+
+
+def _count_store_setups(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls = []
+    original = checkpointing.SqliteStore.setup
+
+    def _setup(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(checkpointing.SqliteStore, "setup", _setup)
+    return calls
+
+
+def _drop_cached_store(store) -> None:
+    checkpointing.get_sqlite_store.cache_clear()
+    del store
+    gc.collect()
+
+
+def test_reopening_initialised_store_path_skips_setup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("LANGGRAPH_DISABLE_CUSTOM_CHECKPOINTER", raising=False)
+    calls = _count_store_setups(monkeypatch)
+    db_path = tmp_path / "store.sqlite"
+
+    store = checkpointing.get_sqlite_store(str(db_path))
+    store.put(("ns",), "key", {"value": 1})
+    assert len(calls) == 1
+    _drop_cached_store(store)
+
+    reopened = checkpointing.get_sqlite_store(str(db_path))
+    assert len(calls) == 1
+    assert reopened.is_setup
+    assert reopened.get(("ns",), "key").value == {"value": 1}
+
+
+def test_recreated_store_path_is_migrated_again(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("LANGGRAPH_DISABLE_CUSTOM_CHECKPOINTER", raising=False)
+    calls = _count_store_setups(monkeypatch)
+    db_path = tmp_path / "recreated.sqlite"
+
+    store = checkpointing.get_sqlite_store(str(db_path))
+    assert len(calls) == 1
+    _drop_cached_store(store)
+
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    db_path.touch()
+
+    recreated = checkpointing.get_sqlite_store(str(db_path))
+    assert len(calls) == 2
+    recreated.put(("ns",), "key", {"value": 2})
+    assert recreated.get(("ns",), "key").value == {"value": 2}
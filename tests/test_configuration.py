@@ -6,7 +6,14 @@ from unittest.mock import patch
 
 import pytest
 
-from email_assistant.configuration import get_llm, normalize_model_spec
+from email_assistant.configuration import get_llm, normalize_model_spec, reset_model_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_model_cache():
+    reset_model_cache()
+    yield
+    reset_model_cache()
 
 
 def test_normalize_model_spec_prefixed_provider(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -18,11 +25,24 @@ def test_normalize_model_spec_prefixed_provider(monkeypatch: pytest.MonkeyPatch)
 
 def test_normalize_model_spec_strips_models_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("EMAIL_ASSISTANT_MODEL_PROVIDER", "google_genai")
+    reset_model_cache()
     spec = normalize_model_spec("models/gemini-1.5-pro")
     assert spec.provider == "google_genai"
     assert spec.model == "gemini-1.5-pro"
 
 
+def test_default_model_is_cached_until_reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EMAIL_ASSISTANT_MODEL", "gemini-2.5-flash")
+    reset_model_cache()
+    assert normalize_model_spec().model == "gemini-2.5-flash"
+
+    monkeypatch.setenv("EMAIL_ASSISTANT_MODEL", "gemini-2.5-pro")
+    assert normalize_model_spec().model == "gemini-2.5-flash"
+
+    reset_model_cache()
+    assert normalize_model_spec().model == "gemini-2.5-pro"
+
+
 def test_get_llm_calls_init_chat_model_with_provider(monkeypatch: pytest.MonkeyPatch) -> None:
     calls: dict[str, object] = {}
 
@@ -49,6 +69,7 @@ def test_get_llm_calls_init_chat_model_with_provider(monkeypatch: pytest.MonkeyP
         return _DummyModel()
 
     monkeypatch.setenv("EMAIL_ASSISTANT_MODEL_PROVIDER", "")
+    reset_model_cache()
     with patch("email_assistant.configuration.init_chat_model", side_effect=_fake_init):
         get_llm(model="google_genai:gemini-1.5-pro", temperature=0.1, max_output_tokens=128)
 
@@ -59,3 +59,23 @@ def test_schedule_meeting_tool_surfaces_failure(monkeypatch):
     )
 
     assert result == "calendar offline"
+
+
+def test_build_gmail_query_buckets_cutoff(monkeypatch):
+    bucket_start = 1_700_000_010  # divisible by the 30 second bucket
+    now = [bucket_start + 17]
+    monkeypatch.setattr(gmail_tools.time, "time", lambda: now[0])
+
+    query = gmail_tools.build_gmail_query("me@example.com", minutes_since=10)
+    assert query == f"(to:me@example.com OR from:me@example.com) after:{bucket_start - 600} is:unread"
+
+    # Still inside the same bucket: the identical (cached) string comes back.
+    now[0] = bucket_start + 29
+    assert gmail_tools.build_gmail_query("me@example.com", minutes_since=10) is query
+
+    # The next bucket moves the cutoff forward by one bucket.
+    now[0] = bucket_start + 30
+    assert f"after:{bucket_start + 30 - 600}" in gmail_tools.build_gmail_query("me@example.com", minutes_since=10)
+
+    with_read = gmail_tools.build_gmail_query("me@example.com", minutes_since=10, include_read=True)
+    assert with_read == f"(to:me@example.com OR from:me@example.com) after:{bucket_start + 30 - 600}"
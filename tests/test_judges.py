@@ -5,6 +5,18 @@ import pytest
 from email_assistant.eval import judges
 
 
+def _reset_reminder_judge_config():
+    from email_assistant.eval.reminder_run_judge import _reset_project_cache
+
+    _reset_project_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_reminder_judge_config():
+    yield
+    _reset_reminder_judge_config()
+
+
 def test_build_tool_call_context_returns_ordered_summary():
     messages = [
         {
@@ -90,3 +102,152 @@ def test_coalesce_placeholder_uses_real_content_when_present():
 
 def test_system_prompt_includes_conference_guidance():
     assert "Conference invitations" in judges.SYSTEM_PROMPT
+
+
+def test_combine_judge_scores_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from email_assistant.eval.composite import combine_judge_scores, combine_judge_scores_batch
+    from email_assistant.eval.reminder_run_judge import ReminderRunJudgeVerdict
+
+    pairs = [(0.9, 0.8), (0.5, 0.2), (0.7, 0.7)]
+    composite, passed = combine_judge_scores_batch(
+        np.array([c for c, _ in pairs]), np.array([r for _, r in pairs])
+    )
+
+    for idx, (correctness, reminder) in enumerate(pairs):
+        scalar = combine_judge_scores(
+            judges.JudgeResult(
+                overall_correctness=correctness,
+                verdict="pass",
+                content_alignment=5,
+                tool_usage=5,
+                missing_tools=[],
+                incorrect_tool_uses=[],
+                evidence=[],
+                notes="",
+            ),
+            ReminderRunJudgeVerdict(reminder_score=reminder, verdict="pass", notes=""),
+        )
+        assert composite[idx] == pytest.approx(scalar.overall_score)
+        assert bool(passed[idx]) == (scalar.verdict == "pass")
+
+
+def test_reminder_judge_async_gathers_forced_verdicts(monkeypatch):
+    import asyncio
+
+    from email_assistant.eval.reminder_run_judge import run_reminder_run_judge_async
+
+    monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "reject")
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+    _reset_reminder_judge_config()
+
+    async def _judge_many():
+        return await asyncio.gather(
+            *(
+                run_reminder_run_judge_async(
+                    email_markdown=f"email {idx}",
+                    assistant_reply="",
+                    reminder_created=[],
+                    reminder_cleared=[],
+                    sender_email="sender@example.com",
+                )
+                for idx in range(3)
+            )
+        )
+
+    verdicts = asyncio.run(_judge_many())
+    assert [v.verdict for v in verdicts] == ["fail", "fail", "fail"]
+    assert all(v.reminder_score == pytest.approx(0.1) for v in verdicts)
+
+
+def test_reminder_judge_sync_runs_inside_event_loop(monkeypatch):
+    import asyncio
+
+    from email_assistant.eval.reminder_run_judge import run_reminder_run_judge
+
+    monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "approve")
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+    _reset_reminder_judge_config()
+
+    async def _call_from_loop():
+        return run_reminder_run_judge(
+            email_markdown="Reminder check",
+            assistant_reply="",
+            reminder_created=[],
+            reminder_cleared=[],
+            sender_email="sender@example.com",
+        )
+
+    verdict = asyncio.run(_call_from_loop())
+    assert verdict.verdict == "pass"
+
+
+def test_reminder_verdict_clips_notes_and_ignores_extra_keys():
+    from email_assistant.eval.reminder_run_judge import ReminderRunJudgeVerdict
+
+    verdict = ReminderRunJudgeVerdict(reminder_score=0.4, verdict="fail", notes="x" * 500)
+    assert len(verdict.notes) == 300
+
+    verdict = ReminderRunJudgeVerdict(reminder_score=0.4, verdict="fail", notes="", unexpected=True)
+    assert not hasattr(verdict, "unexpected")
+
+
+def test_reminder_judge_skips_llm_when_no_reminders(monkeypatch):
+    from email_assistant.eval.reminder_run_judge import run_reminder_run_judge
+
+    monkeypatch.delenv("REMINDER_JUDGE_FORCE_DECISION", raising=False)
+    monkeypatch.delenv("EMAIL_ASSISTANT_LLM_JUDGE", raising=False)
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+    monkeypatch.setenv("EMAIL_ASSISTANT_REMINDER_JUDGE_SKIP_EMPTY", "1")
+    _reset_reminder_judge_config()
+
+    verdict = run_reminder_run_judge(
+        email_markdown="No reminders here",
+        assistant_reply="",
+        reminder_created=[],
+        reminder_cleared=[],
+        sender_email="sender@example.com",
+    )
+
+    assert verdict.verdict == "pass"
+    assert verdict.reminder_score == pytest.approx(1.0)
+
+
+def test_reminder_judge_cache_reuses_llm_verdict(monkeypatch):
+    from email_assistant.eval import reminder_run_judge as rrj
+
+    calls = []
+
+    class _FakeLLM:
+        def with_structured_output(self, schema):
+            assert schema is rrj.ReminderRunJudgeVerdict
+            return self
+
+        def invoke(self, messages):
+            calls.append(messages)
+            return rrj.ReminderRunJudgeVerdict(
+                reminder_score=0.8, verdict="pass", missing_controls=[], notes="ok"
+            )
+
+    monkeypatch.delenv("REMINDER_JUDGE_FORCE_DECISION", raising=False)
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+    monkeypatch.setenv("EMAIL_ASSISTANT_LLM_JUDGE", "1")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setenv("EMAIL_ASSISTANT_REMINDER_JUDGE_CACHE", "1")
+    _reset_reminder_judge_config()
+    monkeypatch.setattr(rrj, "get_llm", lambda model=None: _FakeLLM())
+    monkeypatch.setattr(rrj, "_VERDICT_CACHE", type(rrj._VERDICT_CACHE)())
+
+    kwargs = dict(
+        email_markdown="Please remind me to follow up",
+        assistant_reply="Reminder set",
+        reminder_created=[{"thread_id": "t1", "subject": "Follow up"}],
+        reminder_cleared=[],
+        sender_email="sender@example.com",
+    )
+    first = rrj.run_reminder_run_judge(**kwargs)
+    second = rrj.run_reminder_run_judge(**kwargs)
+
+    assert first is second
+    assert first.reminder_score == pytest.approx(0.8)
+    assert len(calls) == 1
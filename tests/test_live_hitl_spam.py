@@ -28,9 +28,10 @@ def _load_spam_case() -> dict:
 
 
 def _extract_values(state):
-    if hasattr(state, "values"):
+    try:
         return state.values
-    return state
+    except AttributeError:
+        return state
 
 
 @pytest.fixture(autouse=True)
@@ -1,12 +1,16 @@
+import contextvars
 import logging
+import operator
 import os
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import suppress
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, cast
 
 import pytest
 
-from tests.agent_test_utils import compile_agent, has_google_key, is_eval_mode
+from tests.agent_test_utils import build_thread_config, compile_agent, has_google_key, is_eval_mode
 from tests.trace_utils import configure_tracing_project, configure_judge_project
 from email_assistant.tracing import (
     invoke_with_root_run,
@@ -21,8 +25,12 @@ from email_assistant.eval.judges import (
     serialise_messages,
     JudgeUnavailableError,
 )
-from email_assistant.eval.reminder_run_judge import run_reminder_run_judge
+from email_assistant.eval.reminder_run_judge import (
+    _reset_project_cache as _reset_reminder_judge_config,
+    run_reminder_run_judge,
+)
 from email_assistant.eval.composite import run_composite_judge
+from email_assistant.graph import reminder_nodes
 
 try:  # LangSmith logging is optional in offline runs
     from langsmith import testing as t
@@ -30,59 +38,123 @@ except Exception:  # pragma: no cover - logging disabled when LangSmith SDK miss
     t = None
 
 
-def _safe_log_inputs(payload, run_id):
-    if not t:
-        return
-    try:
-        if run_id:
-            t.log_inputs(payload, run_id=run_id)
-        else:
-            t.log_inputs(payload)
-    except Exception:  # pragma: no cover
-        pass
+# Judges only add signal with a real model; eval mode, a missing key or
+# --no-live-judge stop the test once the reminder flow itself has been verified.
+_LIVE_JUDGE_ENABLED = (
+    has_google_key() and not is_eval_mode() and os.getenv("PYTEST_SKIP_LIVE_JUDGE") != "1"
+)
 
+_REMINDER_FIELDS = operator.attrgetter("thread_id", "subject", "due_at", "reason", "status")
 
-def _safe_log_outputs(payload, run_id):
-    if not t:
-        return
-    try:
+
+def _snapshot(reminders):
+    return [
+        {
+            "thread_id": thread_id,
+            "subject": subject,
+            "due_at": due_at.isoformat() if due_at is not None else "",
+            "reason": reason,
+            "status": status,
+        }
+        for thread_id, subject, due_at, reason, status in map(_REMINDER_FIELDS, reminders)
+    ]
+
+
+# LangSmith test logging serialises and uploads payloads; keep that off the
+# test's critical path. Drained by _drain_langsmith_logs before each test ends
+# so uploads still land on the active LangSmith test run.
+_LOG_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reminder-test-log")
+_PENDING_LOGS: List[Future] = []
+
+
+_LOG_INPUTS = t.log_inputs if t else None
+_LOG_OUTPUTS = t.log_outputs if t else None
+
+
+def _do_log(log_fn, payload, run_id):
+    # Fire-and-forget: runs on the log pool, so a failed upload never fails the test.
+    with suppress(Exception):
         if run_id:
-            t.log_outputs(payload, run_id=run_id)
+            log_fn(payload, run_id=run_id)
         else:
-            t.log_outputs(payload)
-    except Exception:  # pragma: no cover
-        pass
+            log_fn(payload)
+
+
+def _submit_log(log_fn, payload, run_id):
+    # Shallow-copy so later stage mutations cannot race the upload, and carry
+    # the context so LangSmith still resolves the active test run.
+    ctx = contextvars.copy_context()
+    _PENDING_LOGS.append(_LOG_POOL.submit(ctx.run, _do_log, log_fn, dict(payload), run_id))
+
+
+def _safe_log_inputs(payload, run_id):
+    if _LOG_INPUTS is not None:
+        _submit_log(_LOG_INPUTS, payload, run_id)
+
 
+def _safe_log_outputs(payload, run_id):
+    if _LOG_OUTPUTS is not None:
+        _submit_log(_LOG_OUTPUTS, payload, run_id)
 
-def _extract_values(state):
-    if hasattr(state, "values"):
-        return state.values
-    return state
 
 @pytest.fixture(autouse=True)
-def _configure_live_reminder_env(monkeypatch):
+def _drain_langsmith_logs():
+    yield
+    wait(_PENDING_LOGS)
+    _PENDING_LOGS.clear()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _configure_live_reminder_env():
+    # Static for the whole module, so configure once and restore at teardown.
+    # Per-run overrides (REMINDER_JUDGE_FORCE_DECISION etc.) stay in each test.
     logging.getLogger("email_assistant.graph.reminder_nodes").setLevel(logging.INFO)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("EMAIL_ASSISTANT_LLM_JUDGE", "1")
+        mp.setenv("EMAIL_ASSISTANT_JUDGE_STRICT", "0")
+        mp.setenv("HITL_AUTO_ACCEPT", "1")
+        mp.setenv("EMAIL_ASSISTANT_SKIP_MARK_AS_READ", "1")
+        if not has_google_key() and not is_eval_mode():
+            mp.setenv("EMAIL_ASSISTANT_EVAL_MODE", "1")
+        # The reminder judge snapshots its env config; re-read it for this module.
+        _reset_reminder_judge_config()
+        yield
+    _reset_reminder_judge_config()
+
+
+@pytest.fixture(autouse=True)
+def _configure_live_reminder_projects():
+    # Function-scoped so it runs after conftest's configure_langsmith_projects
+    # rather than being overwritten by it.
     configure_tracing_project("email-assistant-live-reminders")
     configure_judge_project("email-assistant-judge-live-reminders")
-    monkeypatch.setenv("EMAIL_ASSISTANT_LLM_JUDGE", "1")
-    monkeypatch.setenv("EMAIL_ASSISTANT_JUDGE_STRICT", "0")
-    monkeypatch.setenv("HITL_AUTO_ACCEPT", "1")
-    monkeypatch.setenv("EMAIL_ASSISTANT_SKIP_MARK_AS_READ", "1")
-    if not has_google_key() and not is_eval_mode():
-        monkeypatch.setenv("EMAIL_ASSISTANT_EVAL_MODE", "1")
 
 
-def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_service, tmp_path_factory):
+@pytest.fixture
+def compiled_gmail_agent(agent_module_name, monkeypatch, tmp_path_factory):
+    """Compile the Gmail agent against this test's reminder database.
+
+    REMINDER_DB_PATH is set before compiling so the module-level reminder
+    store binds to it, and the shared reminder-node store is restored at
+    teardown so it cannot leak into later tests.
+    """
+
     if "gmail" not in agent_module_name:
         pytest.skip("Live reminder flow is specific to the Gmail agent")
-
     reminder_db = tmp_path_factory.mktemp("reminder-db") / "reminders.sqlite"
     monkeypatch.setenv("REMINDER_DB_PATH", str(reminder_db))
+    monkeypatch.setattr(reminder_nodes, "_REMINDER_STORE", reminder_nodes._REMINDER_STORE)
+    email_assistant, _, _, module = compile_agent(agent_module_name)
+    return email_assistant, module
+
+
+def test_live_reminder_create_and_cancel(compiled_gmail_agent, monkeypatch, gmail_service):
     monkeypatch.setenv("REMINDER_NOTIFY_EMAIL", "assistant@example.com")
     monkeypatch.setenv("REMINDER_DEFAULT_HOURS", "24")
     monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "hitl")
 
-    email_assistant, thread_config, _, module = compile_agent(agent_module_name)
+    email_assistant, module = compiled_gmail_agent
+    thread_config = build_thread_config()
     run_id = thread_config.get("run_id")
 
     first_email = {
@@ -97,69 +169,71 @@ def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_s
         "thread_id": "thread-reminder-invoice",
     }
 
-    payload = {"email_input": first_email}
+    # Same thread, new message id: reused by the approve stage and the judges.
+    followup_email = {**first_email, "id": "msg-reminder-invoice-2"}
+
     summary = summarize_email_for_grid(first_email)
     _safe_log_inputs({"case": "reminder_create", "email": first_email}, run_id)
 
-    def _invoke_initial():
-        return email_assistant.invoke(payload, config=thread_config, durability="sync")
-
     artifacts: dict[str, object] = {}
 
-    def _snapshot(reminders):
-        return [
-            {
-                "thread_id": r.thread_id,
-                "subject": r.subject,
-                "due_at": getattr(r.due_at, "isoformat", lambda: "")(),
-                "reason": r.reason,
-                "status": r.status,
-            }
-            for r in reminders
-        ]
-
     def _invoke_stage(stage_name: str, stage_payload: dict, stage_summary: str) -> dict:
+        # Keep the last streamed values snapshot rather than re-reading the checkpoint.
+        final_state: dict = {}
         with trace_stage(stage_name, inputs_summary=stage_summary):
-            email_assistant.invoke(stage_payload, config=thread_config, durability="sync")
-        return _extract_values(email_assistant.get_state(thread_config))
+            for final_state in email_assistant.stream(
+                stage_payload, config=thread_config, stream_mode="values", durability="sync"
+            ):
+                pass
+        return final_state
+
+    def _fetch_and_snapshot():
+        # iter_active_reminders already returns a list; query once per stage.
+        reminders = module.reminder_store.iter_active_reminders()
+        return reminders, _snapshot(reminders)
 
     def _run_flow():
         root_run_id = current_root_run_id()
         artifacts["root_run_id"] = root_run_id
-        initial_state = _invoke_stage("agent:reminder:create", payload, summary)
+        # Stage outputs are uploaded together once the flow finishes.
+        log_payloads: list[dict[str, object]] = []
+        artifacts["log_payloads"] = log_payloads
+        initial_state = _invoke_stage("agent:reminder:create", {"email_input": first_email}, summary)
         artifacts["initial_state"] = initial_state
-        reminders_initial = list(module.reminder_store.iter_active_reminders())
+        reminders_initial, initial_snapshot = _fetch_and_snapshot()
         artifacts["initial_reminders"] = reminders_initial
-        _safe_log_outputs(
+        log_payloads.append(
             {
                 "case": "reminder_hitl",
                 "assistant_reply": initial_state.get("assistant_reply"),
                 "tool_trace": format_messages_string(initial_state.get("messages", [])),
-                "reminders": _snapshot(reminders_initial),
-            },
-            root_run_id,
+                "reminders": initial_snapshot,
+            }
         )
 
         monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "approve")
 
-        followup_email = dict(first_email)
-        followup_email["id"] = "msg-reminder-invoice-2"
         followup_payload = {"email_input": followup_email}
         followup_summary = summarize_email_for_grid(followup_email)
         _safe_log_inputs({"case": "reminder_create", "email": followup_email}, root_run_id)
 
         followup_state = _invoke_stage("agent:reminder:create:approve", followup_payload, followup_summary)
+        # Captured as soon as the reminder exists so later stages cannot skew the due window.
+        artifacts["followup_checked_at"] = datetime.now(timezone.utc)
         artifacts["followup_state"] = followup_state
-        reminders_followup = list(module.reminder_store.iter_active_reminders())
+        reminders_followup, followup_snapshot = _fetch_and_snapshot()
         artifacts["followup_reminders"] = reminders_followup
-        _safe_log_outputs(
+        artifacts["followup_snapshot"] = followup_snapshot
+        # Rendered once here and reused by the correctness judge below.
+        followup_tool_trace = format_messages_string(followup_state.get("messages", []))
+        artifacts["followup_tool_trace"] = followup_tool_trace
+        log_payloads.append(
             {
                 "case": "reminder_create",
                 "assistant_reply": followup_state.get("assistant_reply"),
-                "tool_trace": format_messages_string(followup_state.get("messages", [])),
-                "reminders": _snapshot(reminders_followup),
-            },
-            root_run_id,
+                "tool_trace": followup_tool_trace,
+                "reminders": followup_snapshot,
+            }
         )
 
         monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "approve")
@@ -179,16 +253,16 @@ def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_s
 
         reply_state = _invoke_stage("agent:reminder:cancel", reply_payload, reply_summary)
         artifacts["reply_state"] = reply_state
-        reminders_after = list(module.reminder_store.iter_active_reminders())
+        reminders_after, after_snapshot = _fetch_and_snapshot()
         artifacts["reminders_after"] = reminders_after
-        _safe_log_outputs(
+        artifacts["after_snapshot"] = after_snapshot
+        log_payloads.append(
             {
                 "case": "reminder_cancel",
                 "assistant_reply": reply_state.get("assistant_reply"),
                 "tool_trace": format_messages_string(reply_state.get("messages", [])),
-                "reminders": _snapshot(reminders_after),
-            },
-            root_run_id,
+                "reminders": after_snapshot,
+            }
         )
 
         return artifacts
@@ -196,6 +270,7 @@ def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_s
     invoke_with_root_run(_run_flow, root_name="agent:reminder:create", input_summary=summary)
 
     root_run_id = cast(str | None, artifacts.get("root_run_id"))
+    _safe_log_outputs({"stages": artifacts["log_payloads"]}, root_run_id)
 
     initial_state = cast(Dict[str, Any], artifacts["initial_state"])  # type: ignore[arg-type]
     reminders_initial = cast(List[Any], artifacts["initial_reminders"])  # type: ignore[arg-type]
@@ -204,41 +279,25 @@ def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_s
     followup_state = cast(Dict[str, Any], artifacts["followup_state"])  # type: ignore[arg-type]
     reminders_followup = cast(List[Any], artifacts["followup_reminders"])  # type: ignore[arg-type]
     assert any(r.thread_id == "thread-reminder-invoice" for r in reminders_followup)
-    due_delta = reminders_followup[0].due_at - datetime.now(timezone.utc)
-    assert timedelta(hours=23) <= due_delta <= timedelta(hours=25)
+    now_utc = cast(datetime, artifacts["followup_checked_at"])
+    assert now_utc + timedelta(hours=23) <= reminders_followup[0].due_at <= now_utc + timedelta(hours=25)
 
-    followup_email = dict(first_email)
-    followup_email["id"] = "msg-reminder-invoice-2"
-    creation_snapshot = [
-        {
-            "thread_id": r.thread_id,
-            "subject": r.subject,
-            "due_at": getattr(r.due_at, "isoformat", lambda: "")(),
-            "reason": r.reason,
-            "status": r.status,
-        }
-        for r in reminders_followup
-    ]
+    creation_snapshot = cast(List[Dict[str, Any]], artifacts["followup_snapshot"])
 
     reply_state = cast(Dict[str, Any], artifacts["reply_state"])  # type: ignore[arg-type]
     reminders_after = cast(List[Any], artifacts["reminders_after"])  # type: ignore[arg-type]
     assert not any(r.thread_id == "thread-reminder-invoice" for r in reminders_after)
 
+    if not _LIVE_JUDGE_ENABLED:
+        monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "")
+        return
+
     # Secondary correctness judge for the approval run
     messages = followup_state.get("messages", [])
-    tool_trace = format_messages_string(messages)
+    tool_trace = cast(str, artifacts["followup_tool_trace"])
     tool_calls_summary, tool_calls_json = build_tool_call_context(messages)
     raw_payload = serialise_messages(messages)
-    reminder_cleared = [
-        {
-            "thread_id": r.thread_id,
-            "subject": r.subject,
-            "due_at": getattr(r.due_at, "isoformat", lambda: "")(),
-            "reason": r.reason,
-            "status": r.status,
-        }
-        for r in reminders_after
-    ]
+    reminder_cleared = cast(List[Dict[str, Any]], artifacts["after_snapshot"])
 
     judge_project_override = os.getenv("EMAIL_ASSISTANT_JUDGE_PROJECT_OVERRIDE")
     if judge_project_override:
@@ -250,8 +309,12 @@ def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_s
 
     judge_parent_run_id = root_run_id or run_id
 
-    try:
-        correctness_verdict = run_correctness_judge(
+    # The two judges are independent LLM round-trips; run them side by side, each
+    # in its own copy of the current context so tracing parents still resolve.
+    with ThreadPoolExecutor(max_workers=2) as judge_pool:
+        correctness_future = judge_pool.submit(
+            contextvars.copy_context().run,
+            run_correctness_judge,
             email_markdown=followup_state.get("email_markdown", ""),
             assistant_reply=followup_state.get("assistant_reply", ""),
             tool_trace=tool_trace,
@@ -260,13 +323,9 @@ def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_s
             raw_output_optional=raw_payload,
             parent_run_id=judge_parent_run_id,
         )
-    except JudgeUnavailableError as exc:
-        warnings.warn(f"Reminder judge unavailable: {exc}")
-        monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "")
-        return
-
-    try:
-        reminder_verdict = run_reminder_run_judge(
+        reminder_future = judge_pool.submit(
+            contextvars.copy_context().run,
+            run_reminder_run_judge,
             email_markdown=followup_state.get("email_markdown", ""),
             assistant_reply=followup_state.get("assistant_reply", ""),
             reminder_created=creation_snapshot,
@@ -274,6 +333,10 @@ def test_live_reminder_create_and_cancel(agent_module_name, monkeypatch, gmail_s
             sender_email=followup_email.get("from", ""),
             parent_run_id=judge_parent_run_id,
         )
+
+    try:
+        correctness_verdict = correctness_future.result()
+        reminder_verdict = reminder_future.result()
     except JudgeUnavailableError as exc:
         warnings.warn(f"Reminder judge unavailable: {exc}")
         monkeypatch.setenv("REMINDER_JUDGE_FORCE_DECISION", "")
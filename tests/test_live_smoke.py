@@ -48,9 +48,10 @@ def _load_experiment_inputs() -> Dict[str, Dict]:
 
 
 def _extract_values(state):
-    if hasattr(state, "values"):
+    try:
         return state.values
-    return state
+    except AttributeError:
+        return state
 
 
 def _assert_keyword_coverage(case: str, text: str) -> None:
@@ -1,7 +1,7 @@
 import pytest
 import os
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 # Ensure imports from src work by adjusting the path
 import sys
@@ -11,15 +11,36 @@ from email_assistant.tools.reminders import SqliteReminderStore
 from scripts.reminder_worker import check_reminders, list_reminders
 
 
-@pytest.fixture
-def memory_store() -> SqliteReminderStore:
-    """Provides a clean, in-memory SQLite database for each test."""
+class _RecordingDelivery:
+    """Minimal stand-in for a ReminderDelivery that records notified reminders."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def send_notification(self, reminder, *args, **kwargs):
+        self.calls.append(reminder)
+
+
+@pytest.fixture(scope="module")
+def _shared_memory_store() -> SqliteReminderStore:
+    """Creates the in-memory SQLite schema once for the whole module."""
     # Use the special :memory: path for an in-memory DB
     store = SqliteReminderStore(db_path=":memory:")
     store.setup()
     return store
 
 
+@pytest.fixture
+def memory_store(_shared_memory_store: SqliteReminderStore):
+    """Provides the shared in-memory store, emptied after each test."""
+    yield _shared_memory_store
+    # Store methods commit as they go, so clear rows rather than roll back.
+    with _shared_memory_store._connect() as conn:
+        conn.execute("DELETE FROM reminders")
+
+
 def test_add_and_get_reminder(memory_store: SqliteReminderStore):
     """Tests that a reminder can be added and retrieved."""
     thread_id = "thread_123"
@@ -59,6 +80,7 @@ def test_cancel_reminder(memory_store: SqliteReminderStore):
 
     # Verify it is no longer considered active/due
     assert not memory_store.get_due_reminders()
+    assert memory_store.get_active_reminder_for_thread(thread_id) is None
 
     # Verify that trying to cancel again does nothing
     cancelled_again_count = memory_store.cancel_reminder(thread_id)
@@ -71,13 +93,14 @@ def test_worker_finds_due_reminders(memory_store: SqliteReminderStore):
     thread_id_not_due = "thread_not_due"
 
     # Create one reminder that is due and one that is not
-    due_time = datetime.now(timezone.utc) - timedelta(minutes=1)
-    not_due_time = datetime.now(timezone.utc) + timedelta(days=1)
+    now_utc = datetime.now(timezone.utc)
+    due_time = now_utc - timedelta(minutes=1)
+    not_due_time = now_utc + timedelta(days=1)
     memory_store.add_reminder(thread_id_due, "Due Subject", due_time, "is due")
     memory_store.add_reminder(thread_id_not_due, "Not Due Subject", not_due_time, "is not due")
 
-    # Mock the delivery service to see if it gets called
-    mock_delivery = MagicMock()
+    # Record the delivery service calls to see if it gets called
+    mock_delivery = _RecordingDelivery()
 
     # Use patch to replace the factory functions within the scope of this test
     with patch('scripts.reminder_worker.get_default_delivery', return_value=mock_delivery):
@@ -85,12 +108,10 @@ def test_worker_finds_due_reminders(memory_store: SqliteReminderStore):
         check_reminders(memory_store)
 
     # Assert that send_notification was called exactly once
-    mock_delivery.send_notification.assert_called_once()
-    
+    assert len(mock_delivery.calls) == 1
+
     # Assert that it was called with the correct reminder
-    call_args, _ = mock_delivery.send_notification.call_args
-    called_with_reminder = call_args[0]
-    assert called_with_reminder.thread_id == thread_id_due
+    assert mock_delivery.calls[0].thread_id == thread_id_due
 
     # Assert that the due reminder is no longer due after being processed
     assert not memory_store.get_due_reminders()
@@ -105,6 +126,7 @@ def test_iter_active_reminders(memory_store: SqliteReminderStore):
 
     assert len(active) == 1
     assert active[0].thread_id == thread_id
+    assert active[0].subject == "Active Subject"
 
 
 def test_list_reminders_uses_public_api(memory_store: SqliteReminderStore, capfd):
@@ -122,8 +144,9 @@ def test_list_reminders_uses_public_api(memory_store: SqliteReminderStore, capfd
 def test_apply_actions_batch(memory_store: SqliteReminderStore):
     cancel_thread = "thread_to_batch_cancel"
     create_thread = "thread_to_batch_create"
-    due_existing = datetime.now(timezone.utc) + timedelta(hours=6)
-    due_new = datetime.now(timezone.utc) + timedelta(hours=12)
+    now_utc = datetime.now(timezone.utc)
+    due_existing = now_utc + timedelta(hours=6)
+    due_new = now_utc + timedelta(hours=12)
 
     memory_store.add_reminder(cancel_thread, "Existing", due_existing, "existing reminder")
 
@@ -146,3 +169,32 @@ def test_apply_actions_batch(memory_store: SqliteReminderStore):
     created_reminder = memory_store.get_active_reminder_for_thread(create_thread)
     assert created_reminder is not None
     assert created_reminder.subject == "Follow up"
+
+
+def test_stage_reminder_actions_normalises_kinds():
+    from email_assistant.graph.reminder_nodes import stage_reminder_actions
+
+    staged = stage_reminder_actions(
+        "thread-kinds",
+        [
+            {"action": "Cancel"},
+            {"action": {"kind": "create"}},
+            {"action": ["create"]},
+            {"action": None},
+        ],
+        "mark_as_read_node",
+    )
+
+    assert [action["action"] for action in staged["reminder_actions"]] == ["cancel"]
+
+
+def test_apply_actions_cancels_more_threads_than_one_lookup_chunk(memory_store: SqliteReminderStore):
+    due_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    thread_ids = [f"bulk_thread_{i}" for i in range(1200)]
+    for thread_id in thread_ids:
+        memory_store.add_reminder(thread_id, "Bulk", due_at, "bulk")
+
+    result = memory_store.apply_actions([{"action": "cancel", "thread_id": t} for t in thread_ids])
+
+    assert sum(result["cancelled"].values()) == len(thread_ids)
+    assert not memory_store.iter_active_reminders()